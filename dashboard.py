@@ -6,21 +6,84 @@ import os
 os.environ["CHROMA_DB_IMPL"] = "duckdb"
 
 import streamlit as st
-import asyncio
+import re
 import sys
-from datetime import datetime, date, timedelta
+import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from streamlit_option_menu import option_menu
 from dotenv import load_dotenv
 
-# Add src to path
-sys.path.append('src')
+if TYPE_CHECKING:  # plotly is imported lazily inside the chart builders
+    import plotly.graph_objects as go
+
+# Add src to path (absolute, so it resolves regardless of the working directory)
+sys.path.append(str(Path(__file__).resolve().parent / "src"))
+
+# Imported once per process rather than inside handlers that run on every rerun
+import httpx
+from openai import OpenAI
+from tools.serper_search import serper_tool
 
 # Load environment
 load_dotenv()
 
+# Model for the combined report + opportunities completion (override via env)
+STRATEGIC_MODEL = os.getenv("STRATEGIC_MODEL", "gpt-4o")
+# Greedy decoding with a fixed seed, so identical prompts give (near-)identical reports
+ANALYSIS_SEED = 42
+
+# Upper bound on concurrent Serper requests issued by a single analysis run
+SERPER_MAX_WORKERS = 10
+
+# Bump to invalidate memoized analysis results after prompt changes
+ANALYSIS_CACHE_VERSION = 3
+ANALYSIS_CACHE_MAX_ENTRIES = 32
+
+# Completed LLM analyses are shared across sessions when the filled prompts are identical
+LLM_CACHE_TTL = 3600
+LLM_CACHE_MAX_ENTRIES = 64
+
+# Tracked-company names (lowercased) used to auto-detect the industry
+AI_SET = frozenset({"openai", "anthropic", "google ai"})
+SAAS_SET = frozenset({"salesforce", "microsoft", "zoom"})
+FINTECH_SET = frozenset({"paypal", "square", "stripe"})
+
+# Sample data for demonstration, built once at import and shared by every rerun
+_SAMPLE_MARKET_DF = pd.DataFrame({
+    'Date': pd.date_range('2024-01-01', periods=30, freq='D'),
+    'AI_Mentions': np.arange(100, 130, dtype=np.int32),
+    'Funding_Amount': np.array([50, 75, 120, 80, 90, 150, 200, 100, 110, 130,
+                                140, 160, 180, 190, 170, 150, 140, 130, 120, 110,
+                                100, 95, 85, 90, 100, 120, 140, 160, 180, 200], dtype=np.int32)
+})
+
+_SAMPLE_TREND_DF = pd.DataFrame({
+    'Trend': ['Multimodal AI', 'AI Regulation', 'Edge AI', 'AI Agents', 'Enterprise AI'],
+    'Momentum Score': np.array([0.88, 0.75, 0.82, 0.90, 0.85], dtype=np.float32),
+    'Growth Rate': ['65%', '45%', '55%', '70%', '60%']
+})
+
+_SAMPLE_OPPORTUNITIES_DF = pd.DataFrame({
+    'Opportunity': [
+        'Enterprise AI Integration Services',
+        'Industry-Specific AI Solutions', 
+        'AI Training Platform',
+        'AI Compliance Tools',
+        'Edge AI Solutions'
+    ],
+    'Score': np.array([0.85, 0.78, 0.72, 0.80, 0.75], dtype=np.float32),
+    'Priority': ['High', 'High', 'Medium', 'High', 'Medium'],
+    'Revenue Potential': ['$500K-2M', '$1M-5M', '$200K-800K', '$300K-1M', '$400K-1.5M']
+})
+
 # Page configuration
 st.set_page_config(
     page_title="AI Competitive Analysis Dashboard",
@@ -59,39 +122,59 @@ def main():
     elif selected == "Run Analysis":
         show_run_analysis()
 
+@st.cache_resource
+def get_openai_client():
+    """OpenAI client shared across reruns and sessions"""
+    # Explicit keep-alive pool so consecutive analyses reuse warm TLS connections
+    http_client = httpx.Client(
+        limits=httpx.Limits(max_connections=16, max_keepalive_connections=8, keepalive_expiry=30.0),
+        timeout=httpx.Timeout(120.0, connect=10.0),
+    )
+    return OpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=http_client)
+
+@st.cache_resource
+def company_db():
+    """Company search index, built on first use and shared across sessions"""
+    from utils.company_database import load_company_db
+    return load_company_db()
+
+@st.cache_resource
+def get_engine():
+    """Competitive analysis engine, initialized once per process"""
+    from analysis.competitive_engine import competitive_engine
+    return competitive_engine
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_serper(query: str, num_results: int, search_type: str = "search") -> str:
+    """Serper search memoized on its arguments so reruns skip repeat queries"""
+    return serper_tool._run(query, num_results=num_results, search_type=search_type)
+
+@lru_cache(maxsize=32)
+def parse_competitors(raw: str) -> tuple:
+    """Company names from a comma-separated string, stripped, blanks dropped"""
+    return tuple(c.strip() for c in raw.split(",") if c.strip())
+
+def stream_chat_completion(client, **params):
+    """Yield completion text deltas as they arrive from a streaming chat request"""
+    stream = client.chat.completions.create(stream=True, **params)
+    for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
+
+# Overview metric cards, rendered into a single row of columns
+OVERVIEW_METRICS = (
+    {"label": "📊 Market Findings", "value": "0", "delta": "Ready to collect data"},
+    {"label": "🏢 Competitors Tracked", "value": "3", "delta": "OpenAI, Anthropic, Google"},
+    {"label": "📈 Trends Identified", "value": "0", "delta": "Analysis pending"},
+    {"label": "💡 Opportunities", "value": "0", "delta": "Waiting for first run"},
+)
+
 def show_overview():
     """Dashboard overview page"""
     
     # Key metrics
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric(
-            label="📊 Market Findings",
-            value="0",
-            delta="Ready to collect data"
-        )
-    
-    with col2:
-        st.metric(
-            label="🏢 Competitors Tracked",
-            value="3",
-            delta="OpenAI, Anthropic, Google"
-        )
-    
-    with col3:
-        st.metric(
-            label="📈 Trends Identified",
-            value="0", 
-            delta="Analysis pending"
-        )
-    
-    with col4:
-        st.metric(
-            label="💡 Opportunities",
-            value="0",
-            delta="Waiting for first run"
-        )
+    for col, metric in zip(st.columns(len(OVERVIEW_METRICS)), OVERVIEW_METRICS):
+        col.metric(**metric)
     
     # System status
     st.markdown("---")
@@ -119,40 +202,83 @@ def show_overview():
     st.markdown("---")
     st.subheader("🔬 Quick System Test")
     
+    _ai_test_fragment()
+    _search_test_fragment()
+
+@st.fragment
+def _ai_test_fragment():
+    """Test AI Analysis button; clicking it reruns only this fragment"""
     if st.button("Test AI Analysis"):
         with st.spinner("Testing AI capabilities..."):
             try:
-                from openai import OpenAI
-                client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-                
-                response = client.chat.completions.create(
+                st.write_stream(stream_chat_completion(
+                    get_openai_client(),
                     model="gpt-3.5-turbo",
                     messages=[
                         {"role": "system", "content": "You are a competitive analyst."},
                         {"role": "user", "content": "List 3 key AI market trends for 2025 in one sentence each."}
                     ],
                     max_tokens=150
-                )
-                
-                analysis = response.choices[0].message.content
+                ))
                 st.success("🤖 AI Analysis Working!")
-                st.write(analysis)
                 
             except Exception as e:
                 st.error(f"❌ AI test failed: {e}")
-    
+
+@st.fragment
+def _search_test_fragment():
+    """Test Web Search button; clicking it reruns only this fragment"""
     if st.button("Test Web Search"):
         with st.spinner("Testing search capabilities..."):
             try:
-                from tools.serper_search import serper_tool
-                
-                results = serper_tool._run("AI startup news 2025", num_results=3)
+                results = cached_serper("AI startup news 2025", num_results=3)
                 st.success("🔍 Web Search Working!")
                 st.text_area("Search Results", results[:500] + "...", height=150)
                 
             except Exception as e:
                 st.error(f"❌ Search test failed: {e}")
 
+def maybe_downsample(df, max_points=2000):
+    """Stride-sample a dataframe to at most max_points rows before plotting"""
+    if len(df) <= max_points:
+        return df
+    step = -(-len(df) // max_points)  # ceiling division
+    return df.iloc[::step]
+
+@st.cache_resource
+def build_sample_market_fig() -> "go.Figure":
+    """Market mentions line chart, built once and reused across reruns"""
+    import plotly.graph_objects as go
+    # WebGL trace keeps rendering responsive once real findings replace the sample data
+    plot_data = maybe_downsample(_SAMPLE_MARKET_DF)
+    fig = go.Figure(go.Scattergl(x=plot_data['Date'], y=plot_data['AI_Mentions'], mode='lines'))
+    fig.update_layout(title='AI Market Mentions Over Time (Sample)',
+                      xaxis_title='Date', yaxis_title='AI_Mentions')
+    return fig
+
+@st.cache_resource
+def build_sample_funding_fig() -> "go.Figure":
+    """Funding activity bar chart, built once and reused across reruns"""
+    import plotly.express as px
+    return px.bar(_SAMPLE_MARKET_DF.tail(10), x='Date', y='Funding_Amount',
+                  title='AI Funding Activity (Sample - Last 10 Days)')
+
+@st.cache_resource
+def build_sample_trend_fig() -> "go.Figure":
+    """Trend momentum bar chart, built once and reused across reruns"""
+    import plotly.express as px
+    return px.bar(_SAMPLE_TREND_DF, x='Trend', y='Momentum Score',
+                  title='AI Trend Momentum Scores (Sample)',
+                  color='Momentum Score', color_continuous_scale='viridis')
+
+@st.cache_resource
+def build_sample_opportunity_fig() -> "go.Figure":
+    """Opportunity scoring scatter, built once and reused across reruns"""
+    import plotly.express as px
+    return px.scatter(_SAMPLE_OPPORTUNITIES_DF, x='Score', y='Opportunity',
+                      size='Score', color='Priority',
+                      title='Opportunity Scoring Matrix (Sample)')
+
 def show_market_intelligence():
     """Market intelligence page"""
     st.subheader("📊 Market Intelligence")
@@ -162,23 +288,10 @@ def show_market_intelligence():
     # Sample visualization
     st.markdown("### Sample Market Analysis")
     
-    # Create sample data for demonstration
-    sample_data = pd.DataFrame({
-        'Date': pd.date_range('2024-01-01', periods=30, freq='D'),
-        'AI_Mentions': range(100, 130),
-        'Funding_Amount': [50, 75, 120, 80, 90, 150, 200, 100, 110, 130,
-                          140, 160, 180, 190, 170, 150, 140, 130, 120, 110,
-                          100, 95, 85, 90, 100, 120, 140, 160, 180, 200]
-    })
-    
-    fig = px.line(sample_data, x='Date', y='AI_Mentions', 
-                  title='AI Market Mentions Over Time (Sample)')
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(build_sample_market_fig(), use_container_width=True)
     
     # Funding visualization
-    fig2 = px.bar(sample_data.tail(10), x='Date', y='Funding_Amount',
-                  title='AI Funding Activity (Sample - Last 10 Days)')
-    st.plotly_chart(fig2, use_container_width=True)
+    st.plotly_chart(build_sample_funding_fig(), use_container_width=True)
 
 def show_competitors():
     """Competitors page"""
@@ -191,8 +304,7 @@ def show_competitors():
     
     with col1:
         st.markdown("### Tracked Competitors")
-        for comp in competitors:
-            st.markdown(f"- **{comp}** 🔍")
+        st.markdown("\n".join(f"- **{comp}** 🔍" for comp in competitors))
     
     with col2:
         st.markdown("### Monitoring Areas")
@@ -213,18 +325,9 @@ def show_trends():
     st.info("📋 Trend analysis will appear here after running your first analysis.")
     
     # Sample trend visualization
-    trend_data = pd.DataFrame({
-        'Trend': ['Multimodal AI', 'AI Regulation', 'Edge AI', 'AI Agents', 'Enterprise AI'],
-        'Momentum Score': [0.88, 0.75, 0.82, 0.90, 0.85],
-        'Growth Rate': ['65%', '45%', '55%', '70%', '60%']
-    })
+    st.plotly_chart(build_sample_trend_fig(), use_container_width=True)
     
-    fig = px.bar(trend_data, x='Trend', y='Momentum Score',
-                 title='AI Trend Momentum Scores (Sample)',
-                 color='Momentum Score', color_continuous_scale='viridis')
-    st.plotly_chart(fig, use_container_width=True)
-    
-    st.dataframe(trend_data, use_container_width=True)
+    st.dataframe(_SAMPLE_TREND_DF, use_container_width=True)
 
 def show_opportunities():
     """Opportunities page"""
@@ -233,26 +336,10 @@ def show_opportunities():
     st.info("📋 Business opportunities will appear here after running analysis.")
     
     # Sample opportunities
-    sample_opportunities = pd.DataFrame({
-        'Opportunity': [
-            'Enterprise AI Integration Services',
-            'Industry-Specific AI Solutions', 
-            'AI Training Platform',
-            'AI Compliance Tools',
-            'Edge AI Solutions'
-        ],
-        'Score': [0.85, 0.78, 0.72, 0.80, 0.75],
-        'Priority': ['High', 'High', 'Medium', 'High', 'Medium'],
-        'Revenue Potential': ['$500K-2M', '$1M-5M', '$200K-800K', '$300K-1M', '$400K-1.5M']
-    })
-    
-    st.dataframe(sample_opportunities, use_container_width=True)
+    st.dataframe(_SAMPLE_OPPORTUNITIES_DF, use_container_width=True)
     
     # Opportunity scoring visualization
-    fig = px.scatter(sample_opportunities, x='Score', y='Opportunity',
-                     size='Score', color='Priority',
-                     title='Opportunity Scoring Matrix (Sample)')
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(build_sample_opportunity_fig(), use_container_width=True)
 
 def show_run_analysis():
     """Run analysis page"""
@@ -287,28 +374,30 @@ def show_run_analysis():
                 "Autonomous Vehicles", "Blockchain/Crypto", "Robotics"
             ]
             
-            col_a, col_b = st.columns([2, 1])
-            with col_a:
-                industry_search = st.text_input(
-                    "Search Industries:",
-                    placeholder="Type to search or select from popular industries below...",
-                    help="Search for specific industries or market segments"
-                )
+            # A form only reruns the script on submit, not on every edit of the search box
+            with st.form("industry_search_form", clear_on_submit=False):
+                col_a, col_b = st.columns([2, 1])
+                with col_a:
+                    industry_search = st.text_input(
+                        "Search Industries:",
+                        placeholder="Type to search or select from popular industries below...",
+                        help="Search for specific industries or market segments"
+                    )
+                
+                with col_b:
+                    industry_submitted = st.form_submit_button("🔍 Search Industries")
             
-            with col_b:
-                if st.button("🔍 Search Industries"):
-                    if industry_search:
-                        # Real industry search
-                        sys.path.append('src')
-                        from utils.company_database import search_industries
-                        
-                        search_results = search_industries(industry_search)
-                        if search_results:
-                            st.success(f"Found {len(search_results)} matching industries:")
-                            for result in search_results[:3]:
-                                st.write(f"• **{result['name']}** ({result['company_count']} companies)")
-                        else:
-                            st.warning("No matching industries found. Try a different search term.")
+            if industry_submitted and industry_search:
+                # Real industry search
+                search_results = company_db().search_industries(industry_search)
+                if search_results:
+                    st.success(f"Found {len(search_results)} matching industries:")
+                    st.markdown("\n\n".join(
+                        f"• **{result['name']}** ({result['company_count']} companies)"
+                        for result in search_results[:3]
+                    ))
+                else:
+                    st.warning("No matching industries found. Try a different search term.")
             
             # Quick industry selection
             selected_industries = st.multiselect(
@@ -347,29 +436,29 @@ def show_run_analysis():
             st.markdown("##### Company Tracking")
             
             # Company search functionality
-            col_a, col_b = st.columns([3, 1])
-            with col_a:
-                company_search = st.text_input(
-                    "Search Companies:",
-                    placeholder="Type company name to search...",
-                    help="Search for specific companies to track"
-                )
+            with st.form("company_search_form", clear_on_submit=False):
+                col_a, col_b = st.columns([3, 1])
+                with col_a:
+                    company_search = st.text_input(
+                        "Search Companies:",
+                        placeholder="Type company name to search...",
+                        help="Search for specific companies to track"
+                    )
+                
+                with col_b:
+                    company_submitted = st.form_submit_button("🔍 Find Company")
             
-            with col_b:
-                if st.button("🔍 Find Company"):
-                    if company_search:
-                        # Real company search
-                        sys.path.append('src')
-                        from utils.company_database import search_companies
-                        
-                        search_results = search_companies(company_search, limit=5)
-                        if search_results:
-                            st.success(f"Found {len(search_results)} matching companies:")
-                            for result in search_results:
-                                st.write(f"• **{result['name']}** ({result['type']}) - {result['industry']}")
-                                st.write(f"  {result['description']}")
-                        else:
-                            st.warning("No matching companies found. Try a different search term.")
+            if company_submitted and company_search:
+                # Real company search
+                search_results = company_db().search_companies(company_search, limit=5)
+                if search_results:
+                    st.success(f"Found {len(search_results)} matching companies:")
+                    st.markdown("\n\n".join(
+                        f"• **{result['name']}** ({result['type']}) - {result['industry']}\n\n  {result['description']}"
+                        for result in search_results
+                    ))
+                else:
+                    st.warning("No matching companies found. Try a different search term.")
             
             # Popular companies by category
             company_categories = {
@@ -411,16 +500,17 @@ def show_run_analysis():
             if category_companies:
                 all_companies.extend(category_companies)
             if manual_companies:
-                all_companies.extend([c.strip() for c in manual_companies.split(",") if c.strip()])
+                all_companies.extend(parse_competitors(manual_companies))
             
-            competitors = ", ".join(list(set(all_companies)))  # Remove duplicates
+            competitors = ", ".join(dict.fromkeys(all_companies))  # Remove duplicates, keep order
             
             # Auto-detect industry based on selected companies
-            if any(comp in competitors for comp in ["OpenAI", "Anthropic", "Google AI"]):
+            comp_set = {c.lower() for c in parse_competitors(competitors)}
+            if comp_set & AI_SET:
                 industry = "Artificial Intelligence"
-            elif any(comp in competitors for comp in ["Salesforce", "Microsoft", "Zoom"]):
+            elif comp_set & SAAS_SET:
                 industry = "SaaS/Cloud Computing"
-            elif any(comp in competitors for comp in ["PayPal", "Square", "Stripe"]):
+            elif comp_set & FINTECH_SET:
                 industry = "FinTech"
             else:
                 industry = st.text_input(
@@ -512,7 +602,7 @@ def show_run_analysis():
                 # Store analysis configuration
                 analysis_config = {
                     "industry": industry,
-                    "competitors": [c.strip() for c in competitors.split(",") if c.strip()],
+                    "competitors": list(parse_competitors(competitors)),
                     "company_name": company_name,
                     "company_description": company_description,
                     "company_goals": company_goals,
@@ -539,53 +629,46 @@ def show_run_analysis():
                 3. Ensure all dependencies are installed
                 """)
 
+def analysis_cache_key(config):
+    """Hashable key for an analysis config (lists become tuples)"""
+    return (ANALYSIS_CACHE_VERSION,) + tuple(
+        (k, tuple(v) if isinstance(v, list) else v) for k, v in sorted(config.items())
+    )
+
 def run_enhanced_analysis(config):
     """Run enhanced competitive analysis using the new analysis engine"""
-    import asyncio
-    import time
+    # Re-running an identical config returns the memoized results without any API calls
+    cache = st.session_state.setdefault("analysis_cache", {})
+    key = analysis_cache_key(config)
+    if key in cache:
+        st.info("♻️ Showing cached results for this configuration.")
+        return cache[key]
     
     progress_bar = st.progress(0)
     status_text = st.empty()
     
+    def report_progress(pct, msg):
+        progress_bar.progress(pct)
+        status_text.text(msg)
+    
     try:
         # Import the analysis engine
-        sys.path.append('src')
-        from analysis.competitive_engine import competitive_engine
-        
-        # Step 1: Initialize
-        status_text.text("🚀 Initializing competitive analysis engine...")
-        progress_bar.progress(10)
-        time.sleep(1)
-        
-        # Step 2: Market Intelligence
-        status_text.text("📊 Gathering comprehensive market intelligence...")
-        progress_bar.progress(25)
-        time.sleep(2)
-        
-        # Step 3: Competitor Analysis
-        status_text.text("🏢 Analyzing competitor strategies and positioning...")
-        progress_bar.progress(50)
-        time.sleep(2)
-        
-        # Step 4: Strategic Analysis
-        status_text.text("🧠 Generating personalized strategic insights...")
-        progress_bar.progress(75)
-        time.sleep(2)
+        competitive_engine = get_engine()
         
-        # Step 5: Final Processing
-        status_text.text("💡 Identifying opportunities and recommendations...")
-        progress_bar.progress(90)
+        report_progress(10, "🚀 Initializing competitive analysis engine...")
         
         # Run the actual analysis
         # Note: Using synchronous call for Streamlit compatibility
         # In production, would properly handle async
         
         # Simplified analysis for demo (replace with actual engine call)
-        results = run_simplified_analysis(config)
+        results = run_simplified_analysis(config, progress_cb=report_progress)
         
-        progress_bar.progress(100)
-        status_text.text("✅ Analysis complete!")
-        time.sleep(1)
+        report_progress(100, "✅ Analysis complete!")
+        
+        if len(cache) >= ANALYSIS_CACHE_MAX_ENTRIES:
+            cache.pop(next(iter(cache)))
+        cache[key] = results
         
         return results
         
@@ -594,474 +677,687 @@ def run_enhanced_analysis(config):
         # Fallback to simplified analysis
         return run_simplified_analysis(config)
 
-def run_simplified_analysis(config):
-    """Enhanced analysis supporting both industry analysis and company tracking modes"""
-    from tools.serper_search import serper_tool
-    from openai import OpenAI
+@st.cache_resource
+def llm_analysis_store():
+    """Process-wide store of completed LLM analyses, keyed on a digest of the prompts.
+    Shared by every session's script thread, so all access goes through the returned lock."""
+    return threading.Lock(), {}
+
+def prompt_digest(*prompts):
+    """Short stable digest of the filled prompt texts"""
+    h = hashlib.blake2b(digest_size=16)
+    for prompt in prompts:
+        h.update(prompt.encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+@st.cache_resource
+def get_token_encoder():
+    """tiktoken encoder for the analysis model, loaded once per process"""
+    import tiktoken
+    try:
+        return tiktoken.encoding_for_model(STRATEGIC_MODEL)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+def clip_tokens(text, max_tokens):
+    """Truncate text to at most max_tokens tokens of the analysis model"""
+    enc = get_token_encoder()
+    tokens = enc.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return enc.decode(tokens[:max_tokens])
+
+def dedupe_results(text):
+    """Drop search results whose headline already appeared earlier in the text"""
+    seen = set()
+    kept = []
+    for block in text.split("\n\n"):
+        headline = block.strip().split("\n", 1)[0].split(". ", 1)[-1].strip().lower()
+        if headline in seen:
+            continue
+        seen.add(headline)
+        kept.append(block)
+    return "\n\n".join(kept)
+
+def run_parallel_searches(searches):
+    """Run independent Serper searches concurrently.
+    
+    Takes a list of (label, query, num_results, search_type) tuples and returns
+    a dict mapping each label to its formatted search results.
+    """
+    def _search(search):
+        label, query, num_results, search_type = search
+        return label, cached_serper(query, num_results, search_type)
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(SERPER_MAX_WORKERS, len(searches)))) as executor:
+        return dict(executor.map(_search, searches))
+
+# Report prompt templates, filled with str.format_map so only the variable slots change per run.
+# Unused keys are ignored, so every template takes the same shared fields.
+# OPPORTUNITY_PROMPT is appended to the mode's report prompt so both sections come from one completion.
+# The text before the *_DATA block depends only on the company profile, so repeat runs for the
+# same company share a long verbatim prefix that OpenAI's automatic prompt caching can reuse.
+OPPORTUNITIES_SENTINEL = "===OPPORTUNITIES==="
+
+# Body of the report's executive summary section, up to the next level-2 heading.
+# The heading suffix, e.g. "(3-4 Key Strategic Insights)", is skipped.
+EXEC_SUMMARY_RE = re.compile(
+    r"^##\s*Executive Summary[^\n]*\n(.+?)(?=^##\s|\Z)",
+    re.IGNORECASE | re.DOTALL | re.MULTILINE,
+)
+
+INDUSTRY_PROMPT = """
+You are a senior strategic consultant and industry analyst providing comprehensive market intelligence for {company_name} entering the {industry} industry.
+
+## COMPANY PROFILE
+**Company:** {company_name}
+**Target Industry:** {industry}  
+**Description:** {company_description}
+**Strategic Goals:** {company_goals}
+**Analysis Focus:** {focus_areas}
+
+Generate a comprehensive 2000+ word industry analysis report with the following detailed sections:
+
+# 📊 COMPREHENSIVE INDUSTRY ANALYSIS REPORT
+
+## EXECUTIVE SUMMARY (3-4 Key Strategic Insights)
+Provide 3-4 critical strategic insights about the {industry} industry that directly impact {company_name}'s strategy. Include:
+- Most significant market opportunity for {company_name}
+- Biggest competitive threat to monitor
+- Key success factor for market entry
+- Strategic recommendation summary
+
+## 1. MARKET LANDSCAPE & SIZING ANALYSIS
+### Market Economics
+- **Market Size**: Current market size with specific figures (TAM, SAM, SOM)
+- **Growth Projections**: 3-5 year growth forecasts with CAGR
+- **Market Segments**: Breakdown of market by segments and their growth rates
+- **Revenue Models**: Dominant monetization strategies in the industry
+
+### Industry Maturity & Lifecycle
+- **Industry Stage**: Emerging, growth, mature, or declining phase
+- **Market Drivers**: Primary factors driving industry growth
+- **Technology Adoption**: Current tech adoption rates and trends
+- **Regulatory Environment**: Key regulations affecting the industry
+
+## 2. COMPREHENSIVE COMPETITIVE INTELLIGENCE
+### Market Leaders Analysis
+For each major competitor, provide:
+- **Market Position**: Market share and competitive ranking
+- **Competitive Advantages**: Key differentiators and strengths
+- **Business Model**: Revenue streams and pricing strategies
+- **Strategic Moves**: Recent acquisitions, partnerships, product launches
+
+### Competitive Dynamics
+- **Competition Intensity**: Porter's Five Forces analysis
+- **Entry Barriers**: Capital requirements, regulations, network effects
+- **Switching Costs**: Customer acquisition and retention dynamics
+- **Pricing Pressure**: Price competition and margin trends
+
+## 3. STRATEGIC MARKET OPPORTUNITIES
+### Market Gaps & White Spaces
+- **Underserved Segments**: Customer needs not being met
+- **Geographic Opportunities**: Regions with limited competition
+- **Technology Gaps**: Innovation opportunities in the market
+- **Service Gaps**: Areas where current solutions are inadequate
+
+### Emerging Trends Impact
+- **Technology Trends**: AI, automation, digital transformation impacts
+- **Consumer Behavior**: Changing customer expectations and preferences
+- **Business Model Innovation**: New approaches to value creation
+- **Partnership Opportunities**: Strategic alliance possibilities
+
+## 4. STRATEGIC POSITIONING FOR {company_name_upper}
+### Market Entry Strategy
+- **Target Segments**: Most attractive customer segments for entry
+- **Value Proposition**: Unique value {company_name} can offer
+- **Differentiation Strategy**: How to stand out from competitors
+- **Go-to-Market Approach**: Optimal market entry tactics
+
+### Competitive Positioning
+- **Positioning Map**: Where {company_name} fits in competitive landscape
+- **Competitive Advantages**: Strengths to leverage against competitors
+- **Vulnerability Assessment**: Areas where competitors might attack
+- **Defense Strategy**: How to protect market position once established
+
+## 5. FINANCIAL ANALYSIS & PROJECTIONS
+### Investment Requirements
+- **Initial Investment**: Estimated capital requirements for market entry
+- **Ongoing Costs**: Operating expenses and infrastructure needs
+- **Break-even Analysis**: Timeline to profitability
+- **ROI Projections**: Expected return on investment scenarios
+
+### Revenue Potential
+- **Market Share Targets**: Realistic market share goals (1%, 5%, 10%)
+- **Revenue Projections**: 3-year revenue forecasts
+- **Unit Economics**: Customer acquisition cost and lifetime value
+- **Scaling Economics**: How profitability improves with scale
+
+## 6. IMPLEMENTATION ROADMAP & ACTION PLAN
+### Phase 1: Market Entry (0-6 months)
+- **Immediate Actions**: Top 5 priorities for the next 90 days
+- **Resource Allocation**: Key hires, partnerships, and investments
+- **Success Metrics**: KPIs to track market entry progress
+- **Risk Mitigation**: Potential challenges and contingency plans
+
+### Phase 2: Market Expansion (6-18 months)
+- **Growth Strategy**: Plans for scaling operations and customer base
+- **Product Development**: Feature roadmap and innovation priorities
+- **Market Expansion**: Geographic or segment expansion opportunities
+- **Partnership Strategy**: Strategic alliances and ecosystem development
+
+### Phase 3: Market Leadership (18+ months)
+- **Competitive Response**: Anticipating and responding to competitor moves
+- **Innovation Pipeline**: Long-term R&D and product development
+- **Market Defense**: Strategies to maintain competitive advantage
+- **Exit Opportunities**: Potential acquisition or IPO considerations
+
+## 7. RISK ASSESSMENT & MITIGATION
+### Market Risks
+- **Regulatory Risks**: Potential policy changes and compliance issues
+- **Technology Risks**: Disruption from new technologies
+- **Competitive Risks**: New entrants and aggressive competition
+- **Economic Risks**: Market downturns and economic cycles
+
+### Mitigation Strategies
+- **Diversification**: Reducing dependence on single markets or customers
+- **Agility**: Building adaptable business models and operations
+- **Partnerships**: Strategic relationships for risk sharing
+- **Monitoring**: Early warning systems for market changes
+
+Use specific data from the market intelligence to support all recommendations. Make all insights actionable for {company_name} given their profile: {company_description} and goals: {company_goals}.
+"""
+
+TRACKING_PROMPT = """
+You are a senior competitive intelligence analyst and strategic advisor providing comprehensive competitor tracking analysis for {company_name}.
+
+## COMPANY PROFILE
+**Company:** {company_name}
+**Description:** {company_description}
+**Strategic Goals:** {company_goals}
+**Analysis Focus:** {focus_areas}
+
+## COMPANIES BEING TRACKED
+{companies_list}
+
+Generate a comprehensive 2000+ word competitive intelligence report with the following detailed sections:
+
+# 🏢 COMPREHENSIVE COMPETITIVE INTELLIGENCE REPORT
+
+## EXECUTIVE SUMMARY (Key Competitive Insights)
+Provide 4-5 critical competitive intelligence insights that directly impact {company_name}'s strategy:
+- Most significant competitive threat and why
+- Biggest market opportunity revealed by competitor analysis
+- Key competitive advantage {company_name} should leverage
+- Most important strategic move to make in response to competitors
+- Early warning sign to monitor closely
+
+## 1. INDIVIDUAL COMPETITOR DEEP-DIVE ANALYSIS
+For each tracked company ({companies_list}), provide detailed analysis:
+
+### [Competitor Name] Profile
+- **Market Position**: Current market share, ranking, and influence
+- **Business Model**: Revenue streams, pricing strategy, unit economics
+- **Product Portfolio**: Core offerings, recent launches, development pipeline
+- **Competitive Advantages**: Key differentiators and moats
+- **Recent Strategic Moves**: M&A, partnerships, funding, expansions (last 6 months)
+- **Financial Health**: Revenue growth, profitability, funding status
+- **Strategic Direction**: Vision, roadmap, and announced plans
+- **Threat Level to {company_name}**: High/Medium/Low with reasoning
+
+## 2. COMPETITIVE LANDSCAPE MAPPING & DYNAMICS
+### Market Positioning Analysis
+- **Competitive Positioning Map**: Where each competitor sits on key dimensions (price vs features, market focus, etc.)
+- **Market Share Distribution**: Estimated market share of tracked competitors
+- **Competitive Clusters**: Groups of companies competing directly with each other
+- **White Space Opportunities**: Market gaps not covered by major competitors
+
+### Competitive Dynamics
+- **Competition Intensity**: Level of direct competition between tracked companies
+- **Collaboration vs Competition**: Areas where competitors partner vs compete
+- **Ecosystem Relationships**: How competitors interact with broader market ecosystem
+- **Merger & Acquisition Activity**: Recent deals and potential future consolidation
+
+## 3. COMPETITIVE STRENGTHS & WEAKNESSES ANALYSIS
+### Competitive Advantage Assessment
+For each competitor, analyze:
+- **Technology Advantages**: Proprietary tech, IP, R&D capabilities
+- **Market Advantages**: Brand, distribution, customer relationships
+- **Operational Advantages**: Scale, efficiency, cost structure
+- **Strategic Advantages**: Partnerships, ecosystem position, timing
+
+### Vulnerability Analysis
+- **Competitive Weaknesses**: Areas where competitors are vulnerable
+- **Market Blind Spots**: Customer segments or needs competitors are missing
+- **Operational Vulnerabilities**: Scalability, cost, or execution challenges
+- **Strategic Risks**: Dependencies, competitive threats, market changes
+
+## 4. STRATEGIC IMPLICATIONS FOR {company_name_upper}
+### Direct Competitive Threats
+- **Head-to-Head Competition**: Which competitors directly threaten {company_name}
+- **Competitive Response Patterns**: How competitors typically respond to new entrants
+- **Defensive Strategies**: How competitors protect their market position
+- **Attack Vectors**: Where competitors might focus competitive pressure
+
+### Market Opportunities Revealed
+- **Competitive Gaps**: Underserved markets or customer needs
+- **Timing Opportunities**: Windows where competitive response will be slow
+- **Partnership Opportunities**: Potential allies among tracked companies
+- **Acquisition Targets**: Competitors that might be strategic acquisition candidates
+
+### Differentiation Strategy
+- **Unique Value Proposition**: How {company_name} can stand out
+- **Blue Ocean Opportunities**: Uncontested market spaces to pursue
+- **Competitive Positioning**: Optimal positioning relative to competitors
+- **Messaging Strategy**: How to communicate differentiation effectively
+
+## 5. COMPETITIVE INTELLIGENCE & MONITORING FRAMEWORK
+### Intelligence Gathering Priorities
+- **High-Priority Intelligence**: Most critical information to track for each competitor
+- **Early Warning Indicators**: Signals that predict significant competitive moves
+- **Information Sources**: Best sources for ongoing competitive intelligence
+- **Monitoring Frequency**: How often to review each competitor's activities
+
+### Competitive Metrics Dashboard
+- **Market Share Tracking**: Key metrics to monitor market position changes
+- **Product Development**: Indicators of new product/feature development
+- **Financial Health**: Metrics to track competitor financial performance
+- **Strategic Moves**: Types of strategic announcements to monitor
+
+## 6. STRATEGIC RESPONSE & ACTION PLAN
+### Immediate Actions (Next 30-90 Days)
+- **Defensive Moves**: Actions to protect {company_name} from competitive threats
+- **Offensive Opportunities**: Ways to capitalize on competitor weaknesses
+- **Intelligence Operations**: Competitive monitoring systems to implement
+- **Strategic Communications**: Messaging to differentiate from competitors
+
+### Medium-Term Strategy (3-12 Months)
+- **Product Development**: Features/products to develop in response to competition
+- **Market Positioning**: Repositioning strategies based on competitive analysis
+- **Partnership Strategy**: Strategic relationships to build competitive advantage
+- **Market Expansion**: Geographic or segment expansion to outflank competitors
+
+### Long-Term Competitive Strategy (1-3 Years)
+- **Sustainable Advantage**: Building long-term competitive moats
+- **Market Leadership**: Path to becoming a market leader or strong #2
+- **Ecosystem Strategy**: Building platform or ecosystem advantages
+- **Innovation Pipeline**: Long-term R&D strategy to stay ahead
+
+## 7. RISK ASSESSMENT & CONTINGENCY PLANNING
+### Competitive Risks
+- **Price Wars**: Risk of destructive price competition
+- **Feature Wars**: Arms race in product capabilities
+- **Talent Wars**: Competition for key employees and executives
+- **Market Disruption**: Risk of new entrants or technologies
+
+### Contingency Plans
+- **Aggressive Competitor Response**: Plans if competitors respond aggressively
+- **Market Consolidation**: Strategy if industry consolidates rapidly
+- **Technology Disruption**: Response to disruptive technology introduction
+- **Economic Downturn**: Competitive strategy during market contractions
+
+Use specific intelligence data to support all analysis. Make all recommendations immediately actionable for {company_name} based on their profile: {company_description} and strategic goals: {company_goals}.
+"""
+
+OPPORTUNITY_PROMPT = """
+---
+
+When the report above is complete, output a line containing only {opportunities_sentinel} and then continue with a second section: you are now a senior business development strategist identifying high-value opportunities for {company_name} in the {industry} industry, using the same company profile and intelligence data.
+
+Generate a comprehensive opportunity analysis with 5-7 high-impact business opportunities. For each opportunity, provide detailed analysis:
+
+# 💡 STRATEGIC BUSINESS OPPORTUNITIES ANALYSIS
+
+## OPPORTUNITY PRIORITIZATION MATRIX
+Rank all opportunities by:
+- **Strategic Fit** (1-5): Alignment with {company_name}'s capabilities
+- **Market Potential** (1-5): Revenue and growth potential
+- **Competitive Advantage** (1-5): Ability to create sustainable advantage
+- **Implementation Feasibility** (1-5): Ease of execution given resources
+
+## DETAILED OPPORTUNITY ANALYSIS
+
+### OPPORTUNITY 1: [High-Impact Opportunity Name]
+**Priority Level:** High/Medium/Low
+**Strategic Rationale:** Why this is critical for {company_name}
+
+#### Market Analysis
+- **Market Size:** TAM, SAM, SOM with specific figures
+- **Growth Rate:** Historical and projected growth (CAGR)
+- **Market Trends:** Key trends driving this opportunity
+- **Customer Demand:** Evidence of unmet customer needs
+
+#### Competitive Landscape
+- **Competition Level:** Current competitive intensity (Low/Medium/High)
+- **Competitive Gaps:** Specific areas where competitors are weak
+- **Entry Barriers:** Obstacles to entry and how to overcome them
+- **Competitive Response:** How competitors might react
+
+#### Business Model & Economics
+- **Revenue Model:** How {company_name} would monetize this
+- **Unit Economics:** Customer acquisition cost and lifetime value estimates
+- **Pricing Strategy:** Optimal pricing approach and rationale
+- **Break-even Analysis:** Timeline to profitability
+
+#### Implementation Strategy
+- **Resource Requirements:** Capital, personnel, technology needs
+- **Development Timeline:** Phases and milestones (0-6 months, 6-12 months, 12+ months)
+- **Go-to-Market Strategy:** How to launch and scale
+- **Key Success Factors:** Critical elements for success
+
+#### Risk Assessment
+- **Market Risks:** Demand, timing, regulatory risks
+- **Execution Risks:** Technical, operational, competitive risks
+- **Mitigation Strategies:** How to minimize key risks
+- **Success Probability:** Realistic assessment (1-5 scale)
+
+#### Immediate Action Plan
+- **Next 30 Days:** Top 3 immediate actions to pursue this opportunity
+- **Next 90 Days:** Key milestones and deliverables
+- **Resource Allocation:** Budget and team requirements
+- **Success Metrics:** KPIs to track progress
+
+[Repeat this detailed structure for OPPORTUNITIES 2-7]
+
+## OPPORTUNITY PORTFOLIO STRATEGY
+### Portfolio Optimization
+- **Quick Wins:** Low-risk, high-impact opportunities to pursue immediately
+- **Strategic Bets:** Higher-risk, transformational opportunities for long-term growth
+- **Option Value:** Opportunities to keep options open for future pursuit
+- **Resource Allocation:** How to balance investment across opportunities
+
+### Implementation Sequencing
+- **Phase 1 (0-6 months):** Which opportunities to pursue first and why
+- **Phase 2 (6-18 months):** Secondary opportunities and expansion plans
+- **Phase 3 (18+ months):** Long-term strategic opportunities
+- **Synergies:** How opportunities can reinforce each other
+
+## STRATEGIC RECOMMENDATIONS
+### Top 3 Priority Opportunities
+Rank the top 3 opportunities for {company_name} with specific rationale for prioritization.
+
+### Investment Strategy
+- **Total Investment Required:** Aggregate capital requirements
+- **Expected Returns:** Revenue and profit projections
+- **ROI Analysis:** Return on investment for each opportunity
+- **Funding Strategy:** How to finance opportunity development
+
+### Execution Framework
+- **Team Structure:** Key roles and responsibilities needed
+- **Decision Framework:** How to make go/no-go decisions
+- **Performance Monitoring:** Dashboards and review processes
+- **Course Correction:** How to pivot if opportunities don't develop as expected
+
+Focus on opportunities that are specific, measurable, achievable, relevant, and time-bound (SMART). Provide data-driven insights and actionable implementation guidance for {company_name} based on their profile and strategic goals.
+"""
+
+# Per-run search data goes last, after the instructions, so the instruction prefix stays identical.
+INDUSTRY_DATA = """
+---
+
+# SOURCE DATA FOR BOTH SECTIONS
+
+## MARKET INTELLIGENCE DATA
+**Industry Trends & Market Data:**
+{market_results}
+
+**Competitive Landscape Intelligence:**
+{competition_results}
+
+**Key Industry Players Analysis:**
+{competitor_results}
+"""
+
+TRACKING_DATA = """
+---
+
+# SOURCE DATA FOR BOTH SECTIONS
+
+## COMPETITIVE INTELLIGENCE DATA
+{competitor_results}
+
+## MARKET CONTEXT & TRENDS
+{market_results}
+"""
+
+def run_simplified_analysis(config, progress_cb=None):
+    """Enhanced analysis supporting both industry analysis and company tracking modes
     
-    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    progress_cb, if given, is called as progress_cb(percent, message) at each real checkpoint.
+    """
+    client = get_openai_client()
+    
+    def progress(pct, msg):
+        if progress_cb:
+            progress_cb(pct, msg)
     
     # Determine analysis approach based on mode
     analysis_mode = config.get('analysis_mode', '🏭 Industry Analysis')
     
+    progress(25, "📊 Gathering comprehensive market intelligence...")
+    
     if analysis_mode == "🏭 Industry Analysis":
-        # Industry-focused analysis
-        industry_query = f"{config['industry']} market trends analysis opportunities 2025"
-        market_results = serper_tool._run(industry_query, num_results=config['search_depth']//2, search_type="news")
-        
-        # Get industry-wide competitive landscape
-        competition_query = f"{config['industry']} competitive landscape key players 2025"
-        competition_results = serper_tool._run(competition_query, num_results=config['search_depth']//3, search_type="news")
+        # Industry-focused analysis - all searches are independent, so fan them out together
+        searches = [
+            ("market", f"{config['industry']} market trends analysis opportunities 2025", config['search_depth']//2, "news"),
+            ("competition", f"{config['industry']} competitive landscape key players 2025", config['search_depth']//3, "news"),
+        ]
         
         # Analyze top companies in industry
-        competitor_results = []
-        for comp in config['competitors'][:3]:
-            comp_query = f"{comp} {config['industry']} strategy market position 2025"
-            comp_data = serper_tool._run(comp_query, num_results=3, search_type="news")
-            competitor_results.append(f"=== {comp} ===\n{comp_data}")
+        top_competitors = config['competitors'][:3]
+        for comp in top_competitors:
+            searches.append((("competitor", comp), f"{comp} {config['industry']} strategy market position 2025", 3, "news"))
+        
+        search_results = run_parallel_searches(searches)
+        market_results = search_results["market"]
+        competition_results = search_results["competition"]
+        competitor_results = [f"=== {comp} ===\n{search_results[("competitor", comp)]}" for comp in top_competitors]
         
         analysis_context = "industry-wide market analysis"
         
     else:  # Company Tracking mode
         # Company-focused analysis
-        companies = config['competitors'].split(',') if isinstance(config['competitors'], str) else config['competitors']
+        companies = parse_competitors(config['competitors']) if isinstance(config['competitors'], str) else config['competitors']
         
-        # Direct company intelligence gathering
-        competitor_results = []
-        for comp in companies[:5]:  # Track up to 5 companies
-            comp_name = comp.strip()
+        tracked = [comp.strip() for comp in companies[:5]]  # Track up to 5 companies
+        
+        # Direct company intelligence gathering - flatten every company query into one batch
+        searches = []
+        for comp_name in tracked:
             comp_queries = [
                 f"{comp_name} latest news updates strategy 2025",
                 f"{comp_name} product launch funding acquisition 2025",
                 f"{comp_name} market position competitive advantage 2025"
             ]
-            
-            comp_intelligence = []
-            for query in comp_queries:
-                comp_data = serper_tool._run(query, num_results=2, search_type="news")
-                comp_intelligence.append(comp_data)
-            
-            competitor_results.append(f"=== {comp_name} INTELLIGENCE ===\n" + "\n".join(comp_intelligence))
+            for i, query in enumerate(comp_queries):
+                searches.append(((comp_name, i), query, 2, "news"))
         
         # Market context for these companies
         market_context_query = f"{config.get('industry', 'technology')} market context {' '.join(companies[:3])} 2025"
-        market_results = serper_tool._run(market_context_query, num_results=config['search_depth']//3, search_type="news")
+        searches.append(("market", market_context_query, config['search_depth']//3, "news"))
+        
+        search_results = run_parallel_searches(searches)
+        market_results = search_results["market"]
+        
+        # Group responses back by company
+        competitor_results = []
+        for comp_name in tracked:
+            comp_intelligence = [search_results[(comp_name, i)] for i in range(3)]
+            competitor_results.append(f"=== {comp_name} INTELLIGENCE ===\n" + "\n".join(comp_intelligence))
         
         competition_results = ""
         analysis_context = "company tracking and competitive intelligence"
     
+    progress(50, "🏢 Analyzing competitor strategies and positioning...")
+    
+    # Slots shared by every prompt template, computed once and filled with format_map.
+    # Context is budgeted in tokens rather than character slices.
+    # Plain blocks, not the list repr, so newlines and quotes aren't escaped into extra tokens
+    competitor_text = "\n\n".join(competitor_results)
+    prompt_fields = {
+        "company_name": config['company_name'],
+        "company_name_upper": config['company_name'].upper(),
+        "industry": config['industry'],
+        "company_description": config['company_description'],
+        "company_goals": config['company_goals'],
+        "focus_areas": ', '.join(config['focus_areas']),
+        "analysis_mode": analysis_mode,
+    }
+    
     # Step 3: Enhanced Strategic Analysis with mode-specific prompting
     if analysis_mode == "🏭 Industry Analysis":
-        analysis_prompt = f"""
-        You are a senior strategic consultant and industry analyst providing comprehensive market intelligence for {config['company_name']} entering the {config['industry']} industry.
-        
-        ## COMPANY PROFILE
-        **Company:** {config['company_name']}
-        **Target Industry:** {config['industry']}  
-        **Description:** {config['company_description']}
-        **Strategic Goals:** {config['company_goals']}
-        **Analysis Focus:** {', '.join(config['focus_areas'])}
-        
-        ## MARKET INTELLIGENCE DATA
-        **Industry Trends & Market Data:**
-        {market_results[:2500]}
-        
-        **Competitive Landscape Intelligence:**
-        {competition_results[:2000]}
-        
-        **Key Industry Players Analysis:**
-        {str(competitor_results)[:2500]}
-        
-        Generate a comprehensive 2000+ word industry analysis report with the following detailed sections:
-        
-        # 📊 COMPREHENSIVE INDUSTRY ANALYSIS REPORT
-        
-        ## EXECUTIVE SUMMARY (3-4 Key Strategic Insights)
-        Provide 3-4 critical strategic insights about the {config['industry']} industry that directly impact {config['company_name']}'s strategy. Include:
-        - Most significant market opportunity for {config['company_name']}
-        - Biggest competitive threat to monitor
-        - Key success factor for market entry
-        - Strategic recommendation summary
-        
-        ## 1. MARKET LANDSCAPE & SIZING ANALYSIS
-        ### Market Economics
-        - **Market Size**: Current market size with specific figures (TAM, SAM, SOM)
-        - **Growth Projections**: 3-5 year growth forecasts with CAGR
-        - **Market Segments**: Breakdown of market by segments and their growth rates
-        - **Revenue Models**: Dominant monetization strategies in the industry
-        
-        ### Industry Maturity & Lifecycle
-        - **Industry Stage**: Emerging, growth, mature, or declining phase
-        - **Market Drivers**: Primary factors driving industry growth
-        - **Technology Adoption**: Current tech adoption rates and trends
-        - **Regulatory Environment**: Key regulations affecting the industry
-        
-        ## 2. COMPREHENSIVE COMPETITIVE INTELLIGENCE
-        ### Market Leaders Analysis
-        For each major competitor, provide:
-        - **Market Position**: Market share and competitive ranking
-        - **Competitive Advantages**: Key differentiators and strengths
-        - **Business Model**: Revenue streams and pricing strategies
-        - **Strategic Moves**: Recent acquisitions, partnerships, product launches
-        
-        ### Competitive Dynamics
-        - **Competition Intensity**: Porter's Five Forces analysis
-        - **Entry Barriers**: Capital requirements, regulations, network effects
-        - **Switching Costs**: Customer acquisition and retention dynamics
-        - **Pricing Pressure**: Price competition and margin trends
-        
-        ## 3. STRATEGIC MARKET OPPORTUNITIES
-        ### Market Gaps & White Spaces
-        - **Underserved Segments**: Customer needs not being met
-        - **Geographic Opportunities**: Regions with limited competition
-        - **Technology Gaps**: Innovation opportunities in the market
-        - **Service Gaps**: Areas where current solutions are inadequate
-        
-        ### Emerging Trends Impact
-        - **Technology Trends**: AI, automation, digital transformation impacts
-        - **Consumer Behavior**: Changing customer expectations and preferences
-        - **Business Model Innovation**: New approaches to value creation
-        - **Partnership Opportunities**: Strategic alliance possibilities
-        
-        ## 4. STRATEGIC POSITIONING FOR {config['company_name'].upper()}
-        ### Market Entry Strategy
-        - **Target Segments**: Most attractive customer segments for entry
-        - **Value Proposition**: Unique value {config['company_name']} can offer
-        - **Differentiation Strategy**: How to stand out from competitors
-        - **Go-to-Market Approach**: Optimal market entry tactics
-        
-        ### Competitive Positioning
-        - **Positioning Map**: Where {config['company_name']} fits in competitive landscape
-        - **Competitive Advantages**: Strengths to leverage against competitors
-        - **Vulnerability Assessment**: Areas where competitors might attack
-        - **Defense Strategy**: How to protect market position once established
-        
-        ## 5. FINANCIAL ANALYSIS & PROJECTIONS
-        ### Investment Requirements
-        - **Initial Investment**: Estimated capital requirements for market entry
-        - **Ongoing Costs**: Operating expenses and infrastructure needs
-        - **Break-even Analysis**: Timeline to profitability
-        - **ROI Projections**: Expected return on investment scenarios
-        
-        ### Revenue Potential
-        - **Market Share Targets**: Realistic market share goals (1%, 5%, 10%)
-        - **Revenue Projections**: 3-year revenue forecasts
-        - **Unit Economics**: Customer acquisition cost and lifetime value
-        - **Scaling Economics**: How profitability improves with scale
-        
-        ## 6. IMPLEMENTATION ROADMAP & ACTION PLAN
-        ### Phase 1: Market Entry (0-6 months)
-        - **Immediate Actions**: Top 5 priorities for the next 90 days
-        - **Resource Allocation**: Key hires, partnerships, and investments
-        - **Success Metrics**: KPIs to track market entry progress
-        - **Risk Mitigation**: Potential challenges and contingency plans
-        
-        ### Phase 2: Market Expansion (6-18 months)
-        - **Growth Strategy**: Plans for scaling operations and customer base
-        - **Product Development**: Feature roadmap and innovation priorities
-        - **Market Expansion**: Geographic or segment expansion opportunities
-        - **Partnership Strategy**: Strategic alliances and ecosystem development
-        
-        ### Phase 3: Market Leadership (18+ months)
-        - **Competitive Response**: Anticipating and responding to competitor moves
-        - **Innovation Pipeline**: Long-term R&D and product development
-        - **Market Defense**: Strategies to maintain competitive advantage
-        - **Exit Opportunities**: Potential acquisition or IPO considerations
-        
-        ## 7. RISK ASSESSMENT & MITIGATION
-        ### Market Risks
-        - **Regulatory Risks**: Potential policy changes and compliance issues
-        - **Technology Risks**: Disruption from new technologies
-        - **Competitive Risks**: New entrants and aggressive competition
-        - **Economic Risks**: Market downturns and economic cycles
-        
-        ### Mitigation Strategies
-        - **Diversification**: Reducing dependence on single markets or customers
-        - **Agility**: Building adaptable business models and operations
-        - **Partnerships**: Strategic relationships for risk sharing
-        - **Monitoring**: Early warning systems for market changes
-        
-        Use specific data from the market intelligence to support all recommendations. Make all insights actionable for {config['company_name']} given their profile: {config['company_description']} and goals: {config['company_goals']}.
-        """
+        report_template, data_template = INDUSTRY_PROMPT, INDUSTRY_DATA
+        prompt_fields.update({
+            "market_results": clip_tokens(dedupe_results(market_results), 800),
+            "competition_results": clip_tokens(competition_results, 800),
+            "competitor_results": clip_tokens(competitor_text, 800),
+        })
     else:  # Company Tracking mode
-        companies_list = ', '.join([c.strip() for c in config['competitors'].split(',')][:5])
-        analysis_prompt = f"""
-        You are a senior competitive intelligence analyst and strategic advisor providing comprehensive competitor tracking analysis for {config['company_name']}.
-        
-        ## COMPANY PROFILE
-        **Company:** {config['company_name']}
-        **Description:** {config['company_description']}
-        **Strategic Goals:** {config['company_goals']}
-        **Analysis Focus:** {', '.join(config['focus_areas'])}
-        
-        ## COMPANIES BEING TRACKED
-        {companies_list}
-        
-        ## COMPETITIVE INTELLIGENCE DATA
-        {str(competitor_results)[:3500]}
-        
-        ## MARKET CONTEXT & TRENDS
-        {market_results[:2000]}
-        
-        Generate a comprehensive 2000+ word competitive intelligence report with the following detailed sections:
-        
-        # 🏢 COMPREHENSIVE COMPETITIVE INTELLIGENCE REPORT
-        
-        ## EXECUTIVE SUMMARY (Key Competitive Insights)
-        Provide 4-5 critical competitive intelligence insights that directly impact {config['company_name']}'s strategy:
-        - Most significant competitive threat and why
-        - Biggest market opportunity revealed by competitor analysis
-        - Key competitive advantage {config['company_name']} should leverage
-        - Most important strategic move to make in response to competitors
-        - Early warning sign to monitor closely
-        
-        ## 1. INDIVIDUAL COMPETITOR DEEP-DIVE ANALYSIS
-        For each tracked company ({companies_list}), provide detailed analysis:
-        
-        ### [Competitor Name] Profile
-        - **Market Position**: Current market share, ranking, and influence
-        - **Business Model**: Revenue streams, pricing strategy, unit economics
-        - **Product Portfolio**: Core offerings, recent launches, development pipeline
-        - **Competitive Advantages**: Key differentiators and moats
-        - **Recent Strategic Moves**: M&A, partnerships, funding, expansions (last 6 months)
-        - **Financial Health**: Revenue growth, profitability, funding status
-        - **Strategic Direction**: Vision, roadmap, and announced plans
-        - **Threat Level to {config['company_name']}**: High/Medium/Low with reasoning
-        
-        ## 2. COMPETITIVE LANDSCAPE MAPPING & DYNAMICS
-        ### Market Positioning Analysis
-        - **Competitive Positioning Map**: Where each competitor sits on key dimensions (price vs features, market focus, etc.)
-        - **Market Share Distribution**: Estimated market share of tracked competitors
-        - **Competitive Clusters**: Groups of companies competing directly with each other
-        - **White Space Opportunities**: Market gaps not covered by major competitors
-        
-        ### Competitive Dynamics
-        - **Competition Intensity**: Level of direct competition between tracked companies
-        - **Collaboration vs Competition**: Areas where competitors partner vs compete
-        - **Ecosystem Relationships**: How competitors interact with broader market ecosystem
-        - **Merger & Acquisition Activity**: Recent deals and potential future consolidation
-        
-        ## 3. COMPETITIVE STRENGTHS & WEAKNESSES ANALYSIS
-        ### Competitive Advantage Assessment
-        For each competitor, analyze:
-        - **Technology Advantages**: Proprietary tech, IP, R&D capabilities
-        - **Market Advantages**: Brand, distribution, customer relationships
-        - **Operational Advantages**: Scale, efficiency, cost structure
-        - **Strategic Advantages**: Partnerships, ecosystem position, timing
-        
-        ### Vulnerability Analysis
-        - **Competitive Weaknesses**: Areas where competitors are vulnerable
-        - **Market Blind Spots**: Customer segments or needs competitors are missing
-        - **Operational Vulnerabilities**: Scalability, cost, or execution challenges
-        - **Strategic Risks**: Dependencies, competitive threats, market changes
-        
-        ## 4. STRATEGIC IMPLICATIONS FOR {config['company_name'].upper()}
-        ### Direct Competitive Threats
-        - **Head-to-Head Competition**: Which competitors directly threaten {config['company_name']}
-        - **Competitive Response Patterns**: How competitors typically respond to new entrants
-        - **Defensive Strategies**: How competitors protect their market position
-        - **Attack Vectors**: Where competitors might focus competitive pressure
-        
-        ### Market Opportunities Revealed
-        - **Competitive Gaps**: Underserved markets or customer needs
-        - **Timing Opportunities**: Windows where competitive response will be slow
-        - **Partnership Opportunities**: Potential allies among tracked companies
-        - **Acquisition Targets**: Competitors that might be strategic acquisition candidates
-        
-        ### Differentiation Strategy
-        - **Unique Value Proposition**: How {config['company_name']} can stand out
-        - **Blue Ocean Opportunities**: Uncontested market spaces to pursue
-        - **Competitive Positioning**: Optimal positioning relative to competitors
-        - **Messaging Strategy**: How to communicate differentiation effectively
-        
-        ## 5. COMPETITIVE INTELLIGENCE & MONITORING FRAMEWORK
-        ### Intelligence Gathering Priorities
-        - **High-Priority Intelligence**: Most critical information to track for each competitor
-        - **Early Warning Indicators**: Signals that predict significant competitive moves
-        - **Information Sources**: Best sources for ongoing competitive intelligence
-        - **Monitoring Frequency**: How often to review each competitor's activities
-        
-        ### Competitive Metrics Dashboard
-        - **Market Share Tracking**: Key metrics to monitor market position changes
-        - **Product Development**: Indicators of new product/feature development
-        - **Financial Health**: Metrics to track competitor financial performance
-        - **Strategic Moves**: Types of strategic announcements to monitor
-        
-        ## 6. STRATEGIC RESPONSE & ACTION PLAN
-        ### Immediate Actions (Next 30-90 Days)
-        - **Defensive Moves**: Actions to protect {config['company_name']} from competitive threats
-        - **Offensive Opportunities**: Ways to capitalize on competitor weaknesses
-        - **Intelligence Operations**: Competitive monitoring systems to implement
-        - **Strategic Communications**: Messaging to differentiate from competitors
-        
-        ### Medium-Term Strategy (3-12 Months)
-        - **Product Development**: Features/products to develop in response to competition
-        - **Market Positioning**: Repositioning strategies based on competitive analysis
-        - **Partnership Strategy**: Strategic relationships to build competitive advantage
-        - **Market Expansion**: Geographic or segment expansion to outflank competitors
-        
-        ### Long-Term Competitive Strategy (1-3 Years)
-        - **Sustainable Advantage**: Building long-term competitive moats
-        - **Market Leadership**: Path to becoming a market leader or strong #2
-        - **Ecosystem Strategy**: Building platform or ecosystem advantages
-        - **Innovation Pipeline**: Long-term R&D strategy to stay ahead
-        
-        ## 7. RISK ASSESSMENT & CONTINGENCY PLANNING
-        ### Competitive Risks
-        - **Price Wars**: Risk of destructive price competition
-        - **Feature Wars**: Arms race in product capabilities
-        - **Talent Wars**: Competition for key employees and executives
-        - **Market Disruption**: Risk of new entrants or technologies
-        
-        ### Contingency Plans
-        - **Aggressive Competitor Response**: Plans if competitors respond aggressively
-        - **Market Consolidation**: Strategy if industry consolidates rapidly
-        - **Technology Disruption**: Response to disruptive technology introduction
-        - **Economic Downturn**: Competitive strategy during market contractions
-        
-        Use specific intelligence data to support all analysis. Make all recommendations immediately actionable for {config['company_name']} based on their profile: {config['company_description']} and strategic goals: {config['company_goals']}.
-        """
-    
-    response = client.chat.completions.create(
-        model="gpt-4",
-        messages=[
-            {
-                "role": "system",
-                "content": "You are a senior strategic consultant and competitive intelligence expert with 20+ years of experience in market analysis, competitive strategy, and business intelligence. Provide comprehensive, detailed analysis with specific data-driven insights, actionable recommendations, and professional formatting. Your reports should be thorough, strategic, and immediately implementable."
-            },
-            {
-                "role": "user", 
-                "content": analysis_prompt
-            }
-        ],
-        max_tokens=3000,
-        temperature=0.15
+        report_template, data_template = TRACKING_PROMPT, TRACKING_DATA
+        prompt_fields.update({
+            "companies_list": ', '.join(tracked),
+            "competitor_results": clip_tokens(competitor_text, 900),
+            "market_results": clip_tokens(market_results, 500),
+        })
+    prompt_fields["opportunities_sentinel"] = OPPORTUNITIES_SENTINEL
+    
+    # Step 4: Enhanced Opportunity Identification, appended so the shared context is billed once.
+    # Stable instructions first, per-run search data last.
+    analysis_prompt = "".join(
+        template.format_map(prompt_fields)
+        for template in (report_template, OPPORTUNITY_PROMPT, data_template)
     )
     
-    strategic_analysis = response.choices[0].message.content
-    
-    # Step 4: Enhanced Opportunity Identification
-    opportunity_prompt = f"""
-    You are a senior business development strategist identifying high-value opportunities for {config['company_name']} in the {config['industry']} industry.
-    
-    ## COMPANY CONTEXT
-    **Company:** {config['company_name']}
-    **Description:** {config['company_description']}
-    **Strategic Goals:** {config['company_goals']}
-    **Analysis Mode:** {analysis_mode}
-    
-    ## MARKET INTELLIGENCE
-    {market_results[:2000]}
-    
-    ## COMPETITIVE LANDSCAPE
-    {str(competitor_results)[:1500]}
-    
-    Generate a comprehensive opportunity analysis with 5-7 high-impact business opportunities. For each opportunity, provide detailed analysis:
-    
-    # 💡 STRATEGIC BUSINESS OPPORTUNITIES ANALYSIS
-    
-    ## OPPORTUNITY PRIORITIZATION MATRIX
-    Rank all opportunities by:
-    - **Strategic Fit** (1-5): Alignment with {config['company_name']}'s capabilities
-    - **Market Potential** (1-5): Revenue and growth potential
-    - **Competitive Advantage** (1-5): Ability to create sustainable advantage
-    - **Implementation Feasibility** (1-5): Ease of execution given resources
-    
-    ## DETAILED OPPORTUNITY ANALYSIS
-    
-    ### OPPORTUNITY 1: [High-Impact Opportunity Name]
-    **Priority Level:** High/Medium/Low
-    **Strategic Rationale:** Why this is critical for {config['company_name']}
-    
-    #### Market Analysis
-    - **Market Size:** TAM, SAM, SOM with specific figures
-    - **Growth Rate:** Historical and projected growth (CAGR)
-    - **Market Trends:** Key trends driving this opportunity
-    - **Customer Demand:** Evidence of unmet customer needs
-    
-    #### Competitive Landscape
-    - **Competition Level:** Current competitive intensity (Low/Medium/High)
-    - **Competitive Gaps:** Specific areas where competitors are weak
-    - **Entry Barriers:** Obstacles to entry and how to overcome them
-    - **Competitive Response:** How competitors might react
-    
-    #### Business Model & Economics
-    - **Revenue Model:** How {config['company_name']} would monetize this
-    - **Unit Economics:** Customer acquisition cost and lifetime value estimates
-    - **Pricing Strategy:** Optimal pricing approach and rationale
-    - **Break-even Analysis:** Timeline to profitability
-    
-    #### Implementation Strategy
-    - **Resource Requirements:** Capital, personnel, technology needs
-    - **Development Timeline:** Phases and milestones (0-6 months, 6-12 months, 12+ months)
-    - **Go-to-Market Strategy:** How to launch and scale
-    - **Key Success Factors:** Critical elements for success
-    
-    #### Risk Assessment
-    - **Market Risks:** Demand, timing, regulatory risks
-    - **Execution Risks:** Technical, operational, competitive risks
-    - **Mitigation Strategies:** How to minimize key risks
-    - **Success Probability:** Realistic assessment (1-5 scale)
-    
-    #### Immediate Action Plan
-    - **Next 30 Days:** Top 3 immediate actions to pursue this opportunity
-    - **Next 90 Days:** Key milestones and deliverables
-    - **Resource Allocation:** Budget and team requirements
-    - **Success Metrics:** KPIs to track progress
-    
-    [Repeat this detailed structure for OPPORTUNITIES 2-7]
-    
-    ## OPPORTUNITY PORTFOLIO STRATEGY
-    ### Portfolio Optimization
-    - **Quick Wins:** Low-risk, high-impact opportunities to pursue immediately
-    - **Strategic Bets:** Higher-risk, transformational opportunities for long-term growth
-    - **Option Value:** Opportunities to keep options open for future pursuit
-    - **Resource Allocation:** How to balance investment across opportunities
-    
-    ### Implementation Sequencing
-    - **Phase 1 (0-6 months):** Which opportunities to pursue first and why
-    - **Phase 2 (6-18 months):** Secondary opportunities and expansion plans
-    - **Phase 3 (18+ months):** Long-term strategic opportunities
-    - **Synergies:** How opportunities can reinforce each other
-    
-    ## STRATEGIC RECOMMENDATIONS
-    ### Top 3 Priority Opportunities
-    Rank the top 3 opportunities for {config['company_name']} with specific rationale for prioritization.
-    
-    ### Investment Strategy
-    - **Total Investment Required:** Aggregate capital requirements
-    - **Expected Returns:** Revenue and profit projections
-    - **ROI Analysis:** Return on investment for each opportunity
-    - **Funding Strategy:** How to finance opportunity development
-    
-    ### Execution Framework
-    - **Team Structure:** Key roles and responsibilities needed
-    - **Decision Framework:** How to make go/no-go decisions
-    - **Performance Monitoring:** Dashboards and review processes
-    - **Course Correction:** How to pivot if opportunities don't develop as expected
-    
-    Focus on opportunities that are specific, measurable, achievable, relevant, and time-bound (SMART). Provide data-driven insights and actionable implementation guidance for {config['company_name']} based on their profile and strategic goals.
-    """
+    progress(75, "🧠 Generating personalized strategic insights...")
     
-    opp_response = client.chat.completions.create(
-        model="gpt-4",
-        messages=[
-            {"role": "system", "content": "You are a senior business development strategist and opportunity analyst with expertise in market analysis, competitive strategy, and business model innovation. Provide comprehensive, data-driven opportunity analysis with specific implementation guidance."},
-            {"role": "user", "content": opportunity_prompt}
-        ],
-        max_tokens=2500,
-        temperature=0.2
-    )
+    store_lock, store = llm_analysis_store()
+    llm_key = (ANALYSIS_CACHE_VERSION, STRATEGIC_MODEL, prompt_digest(analysis_prompt))
+    with store_lock:
+        cached = store.get(llm_key)
     
-    opportunities = opp_response.choices[0].message.content
+    if cached and time.time() - cached[0] < LLM_CACHE_TTL:
+        # Same prompt as a recent run (this or another session) - reuse its completion
+        strategic_analysis, opportunities = cached[1]
+    else:
+        # One streamed completion returns the report and the opportunities, split on a sentinel line
+        analysis_stream = stream_chat_completion(
+            client,
+            model=STRATEGIC_MODEL,
+            messages=[
+                {
+                    "role": "system",
+                    "content": "You are a senior strategic consultant and competitive intelligence expert with 20+ years of experience in market analysis, competitive strategy, business intelligence, and business model innovation. Provide comprehensive, detailed analysis with specific data-driven insights, actionable recommendations, and professional formatting. Your reports should be thorough, strategic, and immediately implementable."
+                },
+                {
+                    "role": "user", 
+                    "content": analysis_prompt
+                }
+            ],
+            max_tokens=5500,
+            temperature=0,
+            seed=ANALYSIS_SEED
+        )
+        
+        with st.expander("🧠 Strategic analysis (live)", expanded=True):
+            full_text = st.write_stream(analysis_stream)
+        
+        progress(90, "💡 Identifying opportunities and recommendations...")
+        
+        strategic_analysis, found, opportunities = full_text.partition(OPPORTUNITIES_SENTINEL)
+        strategic_analysis = strategic_analysis.strip()
+        opportunities = opportunities.strip() if found else "⚠️ The model did not return a separate opportunities section; see the complete analysis."
+        
+        now = time.time()
+        with store_lock:
+            # Drop expired entries, then the oldest ones, so the bound holds across sessions
+            for key in [key for key, (stored_at, _) in store.items() if now - stored_at >= LLM_CACHE_TTL]:
+                del store[key]
+            store.pop(llm_key, None)
+            while len(store) >= LLM_CACHE_MAX_ENTRIES:
+                del store[next(iter(store))]
+            store[llm_key] = (now, (strategic_analysis, opportunities))
     
     return {
         'strategic_analysis': strategic_analysis,
         'opportunities': opportunities,
         'market_intelligence': market_results,
-        'competitor_intelligence': competitor_results
+        'competitor_intelligence': competitor_results,
+        'generated_at': datetime.now(),
+        # Counted once here; results are memoized, so redisplays never re-split the text
+        'word_counts': (len(strategic_analysis.split()), len(opportunities.split()))
     }
 
+def format_competitor_intelligence(competitor_data):
+    """Readable text for the per-company intelligence blocks"""
+    if not competitor_data:
+        return 'No competitor intelligence data available'
+    if isinstance(competitor_data, list):
+        return "\n\n".join(competitor_data)
+    return str(competitor_data)
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_comprehensive_report(results, config, analysis_mode_clean, generated_at, total_words):
+    """Full text export: strategic analysis, opportunities and the raw intelligence"""
+    competitors = config['competitors']
+    return "\n".join([
+        "",
+        "# COMPREHENSIVE COMPETITIVE ANALYSIS REPORT",
+        "",
+        f"**Company:** {config['company_name']}",
+        f"**Industry:** {config['industry']}",
+        f"**Analysis Type:** {analysis_mode_clean}",
+        f"**Date:** {generated_at.strftime('%B %d, %Y at %H:%M')}",
+        f"**Competitors Analyzed:** {', '.join(competitors) if isinstance(competitors, list) else competitors}",
+        "",
+        "---",
+        "",
+        "## STRATEGIC ANALYSIS",
+        results['strategic_analysis'],
+        "",
+        "---",
+        "",
+        "## BUSINESS OPPORTUNITIES",
+        results['opportunities'],
+        "",
+        "---",
+        "",
+        "## MARKET INTELLIGENCE DATA",
+        results.get('market_intelligence', 'No market intelligence data available'),
+        "",
+        "---",
+        "",
+        "## COMPETITOR INTELLIGENCE",
+        format_competitor_intelligence(results.get('competitor_intelligence')),
+        "",
+        "---",
+        "",
+        "**Report Generated by:** AI Competitive Analysis System",
+        f"**Total Analysis Length:** {total_words:,} words",
+        "**Analysis Depth:** Comprehensive Professional Report",
+    ])
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_summary_report(results, config, analysis_mode_clean, key_insights, generated_at):
+    """Condensed export: key insights and the top of the opportunities section"""
+    return "\n".join([
+        "",
+        "# EXECUTIVE SUMMARY - COMPETITIVE ANALYSIS",
+        "",
+        f"**Company:** {config['company_name']}",
+        f"**Date:** {generated_at.strftime('%B %d, %Y')}",
+        f"**Analysis Type:** {analysis_mode_clean}",
+        "",
+        "## KEY INSIGHTS",
+        key_insights,
+        "",
+        "## TOP OPPORTUNITIES",
+        results['opportunities'][:1500],
+        "",
+        "---",
+        "Full report available in complete download.",
+    ])
+
 def display_analysis_results(results, config):
     """Display the analysis results in a structured format"""
     
@@ -1080,11 +1376,13 @@ def display_analysis_results(results, config):
     
     # Extract executive summary (first section of the analysis)
     analysis_text = results['strategic_analysis']
-    if "## EXECUTIVE SUMMARY" in analysis_text:
-        exec_summary = analysis_text.split("## EXECUTIVE SUMMARY")[1].split("##")[0].strip()
-        st.info(f"🎯 **Key Strategic Insights:**\n\n{exec_summary}")
-    elif "## Executive Summary" in analysis_text:
-        exec_summary = analysis_text.split("## Executive Summary")[1].split("##")[0].strip()
+    opp_text = results['opportunities']
+    analysis_words, opportunity_words = results.get('word_counts') or (len(analysis_text.split()), len(opp_text.split()))
+    
+    exec_summary = None
+    summary_match = EXEC_SUMMARY_RE.search(analysis_text)
+    if summary_match:
+        exec_summary = summary_match.group(1).strip()
         st.info(f"🎯 **Key Strategic Insights:**\n\n{exec_summary}")
     else:
         # Show first 500 characters as summary
@@ -1112,7 +1410,7 @@ def display_analysis_results(results, config):
         
         # Display the full analysis with better formatting
         st.markdown("---")
-        st.markdown(results['strategic_analysis'])
+        st.markdown(analysis_text)
         
         # Analysis metadata
         st.markdown("---")
@@ -1121,24 +1419,26 @@ def display_analysis_results(results, config):
         with col1:
             st.metric("Analysis Type", analysis_mode.replace("🏭 ", "").replace("🏢 ", ""))
         with col2:
-            st.metric("Companies Analyzed", len(config['competitors']) if isinstance(config['competitors'], list) else len(config['competitors'].split(',')))
+            st.metric("Companies Analyzed", len(config['competitors']) if isinstance(config['competitors'], list) else len(parse_competitors(config['competitors'])))
         with col3:
             st.metric("Focus Areas", len(config['focus_areas']))
         with col4:
-            word_count = len(results['strategic_analysis'].split())
-            st.metric("Report Length", f"{word_count:,} words")
+            st.metric("Report Length", f"{analysis_words:,} words")
     
     with tab2:
         st.markdown("## 💡 Strategic Business Opportunities")
         st.markdown("*Comprehensive opportunity analysis with implementation guidance*")
         st.markdown("---")
-        st.markdown(results['opportunities'])
+        st.markdown(opp_text)
         
         # Opportunity metrics
         st.markdown("---")
         st.markdown("### 📊 Opportunity Overview")
-        opp_text = results['opportunities']
-        opportunity_count = opp_text.count("OPPORTUNITY") + opp_text.count("Opportunity")
+        # Count opportunity headings rather than every mention of the word
+        opportunity_count = sum(
+            1 for line in opp_text.splitlines()
+            if line.lstrip().startswith("###") and "opportunity" in line.lower()
+        )
         col1, col2 = st.columns(2)
         with col1:
             st.metric("Opportunities Identified", opportunity_count)
@@ -1153,7 +1453,8 @@ def display_analysis_results(results, config):
         if results.get('market_intelligence'):
             with st.expander("🌍 Market Research Results", expanded=True):
                 st.markdown("### Industry & Market Trends")
-                st.text_area("", results['market_intelligence'], height=300, key="market_data")
+                with st.container(height=300):
+                    st.code(results['market_intelligence'], language="markdown")
                 
                 # Market data metrics
                 market_data = results['market_intelligence']
@@ -1177,10 +1478,12 @@ def display_analysis_results(results, config):
                             pass
                     
                     with st.expander(f"🏢 {company_name} Intelligence", expanded=i==0):
-                        st.text_area("", comp_data, height=250, key=f"comp_{i}")
+                        with st.container(height=250):
+                            st.code(comp_data, language="markdown")
             else:
                 with st.expander("🏢 Competitor Intelligence Data", expanded=True):
-                    st.text_area("", str(competitor_data), height=400, key="all_comp_data")
+                    with st.container(height=400):
+                        st.code(str(competitor_data), language="markdown")
     
     with tab5:
         st.markdown("## 📥 Export & Share Analysis")
@@ -1189,41 +1492,10 @@ def display_analysis_results(results, config):
         # Enhanced report generation
         analysis_mode_clean = config.get('analysis_mode', 'Analysis').replace("🏭 ", "").replace("🏢 ", "")
         
-        comprehensive_report = f"""
-# COMPREHENSIVE COMPETITIVE ANALYSIS REPORT
-
-**Company:** {config['company_name']}
-**Industry:** {config['industry']}
-**Analysis Type:** {analysis_mode_clean}
-**Date:** {datetime.now().strftime('%B %d, %Y at %H:%M')}
-**Competitors Analyzed:** {', '.join(config['competitors']) if isinstance(config['competitors'], list) else config['competitors']}
-
----
-
-## STRATEGIC ANALYSIS
-{results['strategic_analysis']}
-
----
-
-## BUSINESS OPPORTUNITIES
-{results['opportunities']}
-
----
-
-## MARKET INTELLIGENCE DATA
-{results.get('market_intelligence', 'No market intelligence data available')}
-
----
-
-## COMPETITOR INTELLIGENCE
-{str(results.get('competitor_intelligence', 'No competitor intelligence data available'))}
-
----
-
-**Report Generated by:** AI Competitive Analysis System
-**Total Analysis Length:** {len(results['strategic_analysis'].split()) + len(results['opportunities'].split()):,} words
-**Analysis Depth:** Comprehensive Professional Report
-        """
+        # Built once per analysis: the timestamp is fixed when the analysis runs, so reruns hit the cache
+        generated_at = results.get('generated_at') or datetime.now()
+        total_words = analysis_words + opportunity_words
+        comprehensive_report = build_comprehensive_report(results, config, analysis_mode_clean, generated_at, total_words)
         
         # Download options
         col1, col2 = st.columns(2)
@@ -1232,34 +1504,20 @@ def display_analysis_results(results, config):
             st.download_button(
                 label="📄 Download Complete Report (TXT)",
                 data=comprehensive_report,
-                file_name=f"{config['company_name'].replace(' ', '_')}_Competitive_Analysis_{datetime.now().strftime('%Y%m%d_%H%M')}.txt",
+                file_name=f"{config['company_name'].replace(' ', '_')}_Competitive_Analysis_{generated_at.strftime('%Y%m%d_%H%M')}.txt",
                 mime="text/plain",
                 help="Download the complete analysis as a text file"
             )
         
         with col2:
             # Create a summary version
-            summary_report = f"""
-# EXECUTIVE SUMMARY - COMPETITIVE ANALYSIS
-
-**Company:** {config['company_name']}
-**Date:** {datetime.now().strftime('%B %d, %Y')}
-**Analysis Type:** {analysis_mode_clean}
-
-## KEY INSIGHTS
-{exec_summary if 'exec_summary' in locals() else results['strategic_analysis'][:1000]}
-
-## TOP OPPORTUNITIES
-{results['opportunities'][:1500] if len(results['opportunities']) > 1500 else results['opportunities']}
-
----
-Full report available in complete download.
-            """
+            key_insights = exec_summary if exec_summary is not None else results['strategic_analysis'][:1000]
+            summary_report = build_summary_report(results, config, analysis_mode_clean, key_insights, generated_at)
             
             st.download_button(
                 label="📋 Download Executive Summary",
                 data=summary_report,
-                file_name=f"{config['company_name'].replace(' ', '_')}_Executive_Summary_{datetime.now().strftime('%Y%m%d')}.txt",
+                file_name=f"{config['company_name'].replace(' ', '_')}_Executive_Summary_{generated_at.strftime('%Y%m%d')}.txt",
                 mime="text/plain",
                 help="Download a condensed executive summary"
             )
@@ -1270,7 +1528,6 @@ Full report available in complete download.
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            total_words = len(results['strategic_analysis'].split()) + len(results['opportunities'].split())
             st.metric("Total Words", f"{total_words:,}")
         
         with col2:
@@ -0,0 +1,37 @@
+-- Competitive Analysis System - Indexes for a live database
+-- CREATE INDEX CONCURRENTLY builds each index without blocking writes, but it cannot run
+-- inside a transaction block. Run this file with autocommit, one statement at a time, e.g.:
+--   psql "$DATABASE_URL" -f database_indexes.sql
+-- Fresh installs get the same indexes from database_schema.sql (plain CREATE INDEX is
+-- instant on empty tables and works in the SQL editor's single transaction).
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_market_findings_date ON market_findings(date DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_market_findings_category_date ON market_findings(category, date DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_market_findings_category_relevance ON market_findings(category, relevance_score DESC) INCLUDE (title);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_market_findings_relevance ON market_findings(relevance_score DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_competitor_updates_company_date ON competitor_updates(company_name, detected_date DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_competitor_updates_date ON competitor_updates(detected_date DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_competitor_updates_impact ON competitor_updates(impact_level);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_opportunities_score ON opportunities(score DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_opportunities_priority_score ON opportunities(priority, score DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_opportunities_date ON opportunities(created_at DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_trends_momentum ON trends(momentum_score DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_trends_category ON trends(category);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_trends_date ON trends(first_detected DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_analysis_runs_date ON analysis_runs(run_date DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_analysis_runs_status ON analysis_runs(status);
+
+-- JSONB containment/key lookups. Columns created as JSON need converting first (rewrites the table):
+--   ALTER TABLE trends ALTER COLUMN evidence TYPE JSONB USING evidence::jsonb;
+--   ALTER TABLE analysis_runs ALTER COLUMN recommendations TYPE JSONB USING recommendations::jsonb;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_trends_evidence_gin ON trends USING GIN (evidence);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_analysis_runs_recommendations_gin ON analysis_runs USING GIN (recommendations);
+
+-- Single-column indexes superseded by the composites above (same leading column)
+DROP INDEX CONCURRENTLY IF EXISTS idx_market_findings_category;
+DROP INDEX CONCURRENTLY IF EXISTS idx_competitor_updates_company;
+DROP INDEX CONCURRENTLY IF EXISTS idx_opportunities_priority;
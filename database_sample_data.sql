@@ -0,0 +1,26 @@
+-- Competitive Analysis System - Sample data for testing (optional)
+-- Run once after database_schema.sql, in the Supabase SQL editor. It is never applied
+-- automatically; running it again inserts another copy of every row.
+
+INSERT INTO market_findings (date, category, title, summary, content, relevance_score, source_url) VALUES
+('2024-01-20', 'ai_research', 'OpenAI Releases GPT-4 Turbo with Enhanced Capabilities', 'OpenAI announced GPT-4 Turbo with improved performance and lower costs.', 'OpenAI has released GPT-4 Turbo, featuring enhanced capabilities including longer context windows, improved accuracy, and reduced pricing. This represents a significant advancement in large language model technology with potential implications for enterprise AI adoption.', 0.95, 'https://openai.com/blog/gpt-4-turbo'),
+('2024-01-19', 'funding', 'AI Startup Raises $50M Series B for Enterprise Solutions', 'New AI company secures major funding round for B2B AI platform.', 'An emerging AI startup focused on enterprise automation solutions has successfully raised $50M in Series B funding, led by prominent venture capital firms. The funding will accelerate product development and market expansion.', 0.78, 'https://techcrunch.com/example'),
+('2024-01-18', 'regulation', 'EU AI Act Implementation Guidelines Released', 'European Union provides detailed guidance on AI Act compliance.', 'The European Union has released comprehensive implementation guidelines for the AI Act, providing clarity on compliance requirements for AI systems deployed in EU markets. This will significantly impact how AI companies operate in Europe.', 0.82, 'https://ec.europa.eu/example');
+
+INSERT INTO competitor_updates (company_name, update_type, description, impact_level, source_url, detected_date) VALUES
+('OpenAI', 'product_launch', 'Released GPT-4 Turbo with competitive pricing and enhanced capabilities', 'high', 'https://openai.com/blog/gpt-4-turbo', '2024-01-20'),
+('Anthropic', 'partnership', 'Announced strategic partnership with major cloud provider for enterprise AI', 'medium', 'https://anthropic.com/news/partnership', '2024-01-19'),
+('Google AI', 'product_launch', 'Launched new Gemini Pro model with multimodal capabilities', 'high', 'https://deepmind.google/gemini', '2024-01-18');
+
+INSERT INTO opportunities (title, description, market_gap, score, priority, potential_revenue, implementation_complexity, time_to_market) VALUES
+('Enterprise AI Integration Services', 'Comprehensive AI integration consulting for mid-market companies lacking internal AI expertise', 'Limited affordable AI consulting for companies with 100-1000 employees', 0.85, 'high', '$500K-2M annually', 'medium', '3-6 months'),
+('Industry-Specific AI Solutions', 'Vertical AI solutions tailored for healthcare, finance, and manufacturing sectors', 'Generic AI tools lacking industry-specific customization and compliance', 0.78, 'high', '$1M-5M annually', 'high', '6-12 months'),
+('AI Training and Certification Platform', 'Online platform for AI skills development and certification for professionals', 'Gap in structured, practical AI education for working professionals', 0.72, 'medium', '$200K-800K annually', 'medium', '4-8 months');
+
+INSERT INTO trends (trend_name, category, momentum_score, evidence, first_detected, prediction) VALUES
+('Multimodal AI Adoption', 'technology', 0.88, '{"sources": 15, "mentions": 250, "growth_rate": "65%", "investment": "$2.3B"}', '2024-01-15', 'Multimodal AI will become standard for enterprise applications by 2025, driving demand for integration services'),
+('AI Regulation Compliance', 'regulation', 0.75, '{"regulatory_changes": 8, "compliance_demand": "high", "market_size": "$500M"}', '2024-01-10', 'Growing regulatory requirements will create significant demand for AI compliance consulting and tools'),
+('Edge AI Deployment', 'technology', 0.82, '{"hardware_adoption": "45%", "latency_requirements": "critical", "cost_reduction": "30%"}', '2024-01-12', 'Edge AI deployment will accelerate as latency and privacy concerns drive on-device processing needs');
+
+INSERT INTO analysis_runs (run_date, findings_count, opportunities_identified, key_insights, recommendations, execution_time_seconds, status) VALUES
+('2024-01-20', 12, 3, 'Market showing increased AI adoption in enterprise sector with focus on compliance and integration', '["Develop compliance-focused AI solutions", "Expand integration service offerings", "Monitor regulatory developments closely"]', 45.7, 'completed');
@@ -2,10 +2,11 @@
 """
 Deployment script for competitive analysis system
 """
-import os
 import sys
-import subprocess
+import shutil
 import asyncio
+import importlib.util
+from functools import lru_cache
 from pathlib import Path
 
 def check_python_version():
@@ -17,6 +18,31 @@ def check_python_version():
     print(f"✅ Python {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}")
     return True
 
+@lru_cache(maxsize=4)
+def _cached_dotenv_values(env_path: str, mtime_ns: int) -> dict:
+    """Parsed .env contents; the mtime in the key invalidates the cache when the file changes.
+    Stdlib only, since this runs before install_dependencies() has installed python-dotenv."""
+    values = {}
+    for line in Path(env_path).read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        if line.startswith("export "):
+            line = line[len("export "):]
+        key, value = line.split("=", 1)
+        value = value.strip()
+        if value[:1] in ("'", '"') and value.endswith(value[0]) and len(value) > 1:
+            value = value[1:-1]
+        else:
+            value = value.split(" #", 1)[0].strip()
+        values[key.strip()] = value
+    return values
+
+def load_env_values(env_file=Path(".env")) -> dict:
+    """Parse an env file once per modification and return its key/value pairs"""
+    env_file = Path(env_file)
+    return _cached_dotenv_values(str(env_file.resolve()), env_file.stat().st_mtime_ns)
+
 def check_environment_file():
     """Check if .env file exists and is configured"""
     print("\n⚙️  Checking environment configuration...")
@@ -28,15 +54,13 @@ def check_environment_file():
         return False
     
     # Check for required variables
-    with open(env_file) as f:
-        content = f.read()
+    values = load_env_values(env_file)
     
     required_vars = ["SUPABASE_URL", "SUPABASE_KEY", "OPENAI_API_KEY", "SERPER_API_KEY"]
-    missing_vars = []
-    
-    for var in required_vars:
-        if f"{var}=your_" in content or f"{var}=" not in content:
-            missing_vars.append(var)
+    missing_vars = [
+        var for var in required_vars
+        if not values.get(var) or values[var].startswith("your_")
+    ]
     
     if missing_vars:
         print(f"❌ Configure these variables in .env: {', '.join(missing_vars)}")
@@ -45,19 +69,29 @@ def check_environment_file():
     print("✅ Environment file configured")
     return True
 
-def install_dependencies():
+async def install_dependencies():
     """Install Python dependencies"""
     print("\n📦 Installing dependencies...")
-    try:
-        subprocess.run([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"], 
-                      check=True, capture_output=True)
+    # uv resolves and installs far faster than pip; fall back to a quiet pip without the version check
+    if shutil.which("uv"):
+        command = ["uv", "pip", "install", "--python", sys.executable, "-r", "requirements.txt"]
+    else:
+        command = [sys.executable, "-m", "pip", "install", "-r", "requirements.txt",
+                   "--disable-pip-version-check", "--no-input", "--quiet"]
+    # Discard the progress log; keep only stderr, which is small and holds the diagnostics
+    proc = await asyncio.create_subprocess_exec(
+        *command, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE
+    )
+    _, stderr = await proc.communicate()
+    if proc.returncode == 0:
         print("✅ Dependencies installed")
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Failed to install dependencies: {e}")
-        return False
+    print(f"❌ Failed to install dependencies: exit status {proc.returncode}")
+    if stderr:
+        print(stderr.decode(errors="replace").strip())
+    return False
 
-def create_directories():
+async def create_directories():
     """Create necessary directories"""
     print("\n📁 Creating directories...")
     directories = ["logs", "data", "temp"]
@@ -73,18 +107,19 @@ async def test_system():
     print("\n🧪 Running system tests...")
     
     try:
-        # Add src to path for testing
-        sys.path.append(str(Path("src").absolute()))
-        
-        # Import test function
-        from test_integration import test_imports, test_database_connection
+        # Load the integration tests straight from their file; it puts src on the path itself
+        spec = importlib.util.spec_from_file_location(
+            "test_integration", Path(__file__).resolve().parent / "test_integration.py"
+        )
+        test_integration = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(test_integration)
         
         # Test imports
-        if not test_imports():
+        if not test_integration.test_imports():
             return False
         
         # Test database
-        if not await test_database_connection():
+        if not await test_integration.test_database_connection():
             return False
         
         print("✅ System tests passed")
@@ -94,24 +129,21 @@ async def test_system():
         print(f"❌ System tests failed: {e}")
         return False
 
-def setup_database():
+async def setup_database():
     """Setup database schema"""
     print("\n🗄️  Setting up database...")
     
-    try:
-        subprocess.run([sys.executable, "setup_database.py"], check=True)
+    proc = await asyncio.create_subprocess_exec(sys.executable, "setup_database.py")
+    if await proc.wait() == 0:
         print("✅ Database setup completed")
-        return True
-    except subprocess.CalledProcessError:
+    else:
         print("⚠️  Database setup had issues - please run manually if needed")
-        return True  # Don't fail deployment for this
+    return True  # Don't fail deployment for this
 
-def create_startup_scripts():
-    """Create startup scripts for different platforms"""
-    print("\n📜 Creating startup scripts...")
-    
-    # Unix/Linux/Mac script
-    unix_script = """#!/bin/bash
+# Startup scripts written by create_startup_scripts
+
+# Unix/Linux/Mac script
+UNIX_SCRIPT = """#!/bin/bash
 # Competitive Analysis System - Startup Script
 
 echo "🚀 Starting Competitive Analysis System..."
@@ -128,34 +160,32 @@ if [ ! -f ".env" ]; then
     exit 1
 fi
 
+# Stop a scheduler left over from a previous run
+mkdir -p logs
+if [ -f logs/sched.pid ]; then
+    kill "$(cat logs/sched.pid)" 2>/dev/null
+    rm -f logs/sched.pid
+fi
+
 # Start the scheduler in background
 echo "🕒 Starting scheduler..."
-python src/utils/scheduler.py start &
+python src/utils/scheduler.py start >logs/sched.log 2>&1 &
 SCHEDULER_PID=$!
+echo "$SCHEDULER_PID" > logs/sched.pid
 
-# Start the dashboard
-echo "📊 Starting dashboard..."
-streamlit run src/ui/app.py --server.headless true --server.port 8501 &
-DASHBOARD_PID=$!
-
-echo "✅ System started successfully!"
+echo "✅ System starting..."
 echo "   Dashboard: http://localhost:8501"
-echo "   Scheduler PID: $SCHEDULER_PID"
-echo "   Dashboard PID: $DASHBOARD_PID"
+echo "   Scheduler PID: $SCHEDULER_PID (log: logs/sched.log)"
+echo '   Stop the scheduler with: kill $(cat logs/sched.pid)'
 echo ""
-echo "Press Ctrl+C to stop all services"
 
-# Wait for interrupt
-trap 'echo "🛑 Stopping services..."; kill $SCHEDULER_PID $DASHBOARD_PID; exit' INT
-wait
+# Replace this shell with the dashboard so no idle parent process is left behind
+echo "📊 Starting dashboard..."
+exec streamlit run src/ui/app.py --server.headless true --server.port 8501
 """
-    
-    with open("start.sh", "w") as f:
-        f.write(unix_script)
-    os.chmod("start.sh", 0o755)
-    
-    # Windows script
-    windows_script = """@echo off
+
+# Windows script
+WINDOWS_SCRIPT = """@echo off
 REM Competitive Analysis System - Startup Script
 
 echo 🚀 Starting Competitive Analysis System...
@@ -186,9 +216,20 @@ echo.
 echo Press any key to continue...
 pause
 """
+
+def _write_if_changed(path: Path, content: str, mode=None):
+    """Write content to path unless the file already holds exactly that content"""
+    if not (path.exists() and path.read_text() == content):
+        path.write_text(content)
+    if mode is not None and path.stat().st_mode & 0o777 != mode:
+        path.chmod(mode)
+
+async def create_startup_scripts():
+    """Create startup scripts for different platforms"""
+    print("\n📜 Creating startup scripts...")
     
-    with open("start.bat", "w") as f:
-        f.write(windows_script)
+    _write_if_changed(Path("start.sh"), UNIX_SCRIPT, mode=0o755)
+    _write_if_changed(Path("start.bat"), WINDOWS_SCRIPT)
     
     print("✅ Startup scripts created (start.sh, start.bat)")
     return True
@@ -232,17 +273,14 @@ async def main():
         print("\n💡 To fix: Copy .env.example to .env and configure your API keys")
         return
     
-    # Installation steps
-    if not install_dependencies():
+    # Installation steps; none of these depend on each other, so let them overlap
+    installed, dirs_ok, scripts_ok = await asyncio.gather(
+        install_dependencies(), create_directories(), create_startup_scripts()
+    )
+    if not (installed and dirs_ok and scripts_ok):
         return
     
-    if not create_directories():
-        return
-    
-    setup_database()  # This can have issues but shouldn't fail deployment
-    
-    if not create_startup_scripts():
-        return
+    await setup_database()  # This can have issues but shouldn't fail deployment
     
     # System tests
     if not await test_system():
@@ -4,55 +4,57 @@ Quick test script to verify API keys work without complex dependencies
 """
 import os
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
-def test_openai_api():
-    """Test OpenAI API connection"""
-    print("🧪 Testing OpenAI API...")
+# One keep-alive session for every probe; the two OpenAI probes share pooled connections
+SESSION = requests.Session()
+SESSION.headers.update({"Content-Type": "application/json"})
+SESSION.mount("https://api.openai.com", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+def test_openai_api(api_key):
+    """Test OpenAI API connection; returns (passed, report lines)"""
+    lines = ["🧪 Testing OpenAI API..."]
     
-    api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
-        print("❌ OpenAI API key not found")
-        return False
+        lines.append("❌ OpenAI API key not found")
+        return False, lines
     
     try:
         headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
+            "Authorization": f"Bearer {api_key}"
         }
         
-        # Simple API test
-        response = requests.get(
-            "https://api.openai.com/v1/models", 
+        # Fetch a single model record; it validates the key without downloading the full model list
+        response = SESSION.get(
+            "https://api.openai.com/v1/models/gpt-3.5-turbo", 
             headers=headers,
             timeout=10
         )
         
         if response.status_code == 200:
-            models = response.json()
-            print(f"✅ OpenAI API working - Found {len(models.get('data', []))} models")
-            return True
+            lines.append(f"✅ OpenAI API working - {response.json().get('id', 'model')} available")
+            return True, lines
         else:
-            print(f"❌ OpenAI API error: {response.status_code}")
-            return False
+            lines.append(f"❌ OpenAI API error: {response.status_code}")
+            return False, lines
             
     except Exception as e:
-        print(f"❌ OpenAI API test failed: {e}")
-        return False
+        lines.append(f"❌ OpenAI API test failed: {e}")
+        return False, lines
 
-def test_serper_api():
+def test_serper_api(api_key):
     """Test Serper search API"""
-    print("\n🧪 Testing Serper API...")
+    lines = ["\n🧪 Testing Serper API..."]
     
-    api_key = os.getenv("SERPER_API_KEY")
     if not api_key:
-        print("❌ Serper API key not found")
-        return False
+        lines.append("❌ Serper API key not found")
+        return False, lines
     
     try:
         headers = {
-            "X-API-KEY": api_key,
-            "Content-Type": "application/json"
+            "X-API-KEY": api_key
         }
         
         data = {
@@ -60,7 +62,7 @@ def test_serper_api():
             "num": 3
         }
         
-        response = requests.post(
+        response = SESSION.post(
             "https://google.serper.dev/search",
             headers=headers,
             json=data,
@@ -70,66 +72,62 @@ def test_serper_api():
         if response.status_code == 200:
             results = response.json()
             organic_count = len(results.get("organic", []))
-            print(f"✅ Serper API working - Found {organic_count} search results")
-            return True
+            lines.append(f"✅ Serper API working - Found {organic_count} search results")
+            return True, lines
         else:
-            print(f"❌ Serper API error: {response.status_code}")
-            return False
+            lines.append(f"❌ Serper API error: {response.status_code}")
+            return False, lines
             
     except Exception as e:
-        print(f"❌ Serper API test failed: {e}")
-        return False
+        lines.append(f"❌ Serper API test failed: {e}")
+        return False, lines
 
-def test_supabase_connection():
+def test_supabase_connection(url, key):
     """Test Supabase connection"""
-    print("\n🧪 Testing Supabase connection...")
-    
-    url = os.getenv("SUPABASE_URL")
-    key = os.getenv("SUPABASE_KEY")
+    lines = ["\n🧪 Testing Supabase connection..."]
     
     if not url or not key:
-        print("❌ Supabase credentials not found")
-        return False
+        lines.append("❌ Supabase credentials not found")
+        return False, lines
     
     try:
         # Test basic connection to Supabase REST API
         headers = {
             "apikey": key,
-            "Authorization": f"Bearer {key}",
-            "Content-Type": "application/json"
+            "Authorization": f"Bearer {key}"
         }
         
-        # Try to access the API (this should work even if no tables exist)
-        response = requests.get(
+        # Try to access the API (this should work even if no tables exist);
+        # HEAD skips the OpenAPI spec a GET on this path would return
+        response = SESSION.head(
             f"{url}/rest/v1/",
             headers=headers,
-            timeout=10
+            timeout=10,
+            allow_redirects=True
         )
         
         if response.status_code in [200, 404]:  # 404 is fine, means API is accessible
-            print("✅ Supabase connection working")
-            return True
+            lines.append("✅ Supabase connection working")
+            return True, lines
         else:
-            print(f"❌ Supabase connection error: {response.status_code}")
-            return False
+            lines.append(f"❌ Supabase connection error: {response.status_code}")
+            return False, lines
             
     except Exception as e:
-        print(f"❌ Supabase connection test failed: {e}")
-        return False
+        lines.append(f"❌ Supabase connection test failed: {e}")
+        return False, lines
 
-def test_ai_completion():
+def test_ai_completion(api_key):
     """Test a simple AI completion"""
-    print("\n🧪 Testing AI completion...")
+    lines = ["\n🧪 Testing AI completion..."]
     
-    api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
-        print("❌ OpenAI API key not found")
-        return False
+        lines.append("❌ OpenAI API key not found")
+        return False, lines
     
     try:
         headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
+            "Authorization": f"Bearer {api_key}"
         }
         
         data = {
@@ -140,7 +138,7 @@ def test_ai_completion():
             "max_tokens": 50
         }
         
-        response = requests.post(
+        response = SESSION.post(
             "https://api.openai.com/v1/chat/completions",
             headers=headers,
             json=data,
@@ -150,16 +148,16 @@ def test_ai_completion():
         if response.status_code == 200:
             result = response.json()
             message = result["choices"][0]["message"]["content"]
-            print(f"✅ AI completion working")
-            print(f"   Sample response: {message[:100]}...")
-            return True
+            lines.append(f"✅ AI completion working")
+            lines.append(f"   Sample response: {message[:100]}...")
+            return True, lines
         else:
-            print(f"❌ AI completion error: {response.status_code}")
-            return False
+            lines.append(f"❌ AI completion error: {response.status_code}")
+            return False, lines
             
     except Exception as e:
-        print(f"❌ AI completion test failed: {e}")
-        return False
+        lines.append(f"❌ AI completion test failed: {e}")
+        return False, lines
 
 def main():
     """Main test function"""
@@ -168,17 +166,27 @@ def main():
     
     load_dotenv()
     
+    # Read the credentials once and hand each probe what it needs
+    cfg = {k: os.environ.get(k) for k in ("OPENAI_API_KEY", "SERPER_API_KEY", "SUPABASE_URL", "SUPABASE_KEY")}
+    
     # Run all tests
     tests = [
-        test_openai_api,
-        test_serper_api,
-        test_supabase_connection,
-        test_ai_completion
+        (test_openai_api, (cfg["OPENAI_API_KEY"],)),
+        (test_serper_api, (cfg["SERPER_API_KEY"],)),
+        (test_supabase_connection, (cfg["SUPABASE_URL"], cfg["SUPABASE_KEY"])),
+        (test_ai_completion, (cfg["OPENAI_API_KEY"],))
     ]
     
+    # The probes are independent network calls, so run them side by side;
+    # total time is the slowest probe rather than the sum of all four
+    # Each probe returns its report lines, printed in order afterwards so the output doesn't interleave
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        reports = list(executor.map(lambda test: test[0](*test[1]), tests))
+    
     results = []
-    for test in tests:
-        results.append(test())
+    for ok, lines in reports:
+        print("\n".join(lines))
+        results.append(ok)
     
     # Summary
     passed = sum(results)
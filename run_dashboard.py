@@ -4,7 +4,6 @@ Dashboard startup script with ChromaDB SQLite fix
 """
 import os
 import sys
-import subprocess
 
 # Set ChromaDB backend to avoid SQLite version issues
 os.environ["CHROMA_DB_IMPL"] = "duckdb"
@@ -14,16 +13,15 @@ def main():
     print("🚀 Starting AI Competitive Analysis Dashboard...")
     print("🔧 Environment: ChromaDB backend set to DuckDB (SQLite compatibility fix)")
     
+    # Replace this interpreter with streamlit rather than waiting on a child
+    sys.stdout.flush()
     try:
-        # Start Streamlit with the dashboard
-        subprocess.run([
+        os.execvp(sys.executable, [
             sys.executable, "-m", "streamlit", "run", "dashboard.py",
             "--server.port", "8501",
             "--server.address", "localhost"
-        ], check=True)
-    except KeyboardInterrupt:
-        print("\n👋 Dashboard stopped by user")
-    except subprocess.CalledProcessError as e:
+        ])
+    except OSError as e:
         print(f"❌ Error starting dashboard: {e}")
         print("\n🔧 Troubleshooting:")
         print("1. Ensure all dependencies are installed: pip install -r requirements.txt")
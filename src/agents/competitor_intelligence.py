@@ -2,26 +2,101 @@
 Competitor Intelligence Agent for competitive analysis
 """
 from crewai import Agent
-from langchain_openai import ChatOpenAI
 from typing import Dict, Any, List
-import os
+import asyncio
 from datetime import datetime, date
-import json
 
-from ..tools.serper_search import serper_tool
-from ..config.company_context import COMPANY_CONTEXT, ANALYSIS_PROMPTS
+from ..tools.serper_search import serper_tool, compact_search_results
+from ..config.company_context import COMPANY_CONTEXT, COMPANY_CONTEXT_STRINGS, ANALYSIS_PROMPTS
 from ..database.supabase_client import db_client
-from ..database.models import CompetitorUpdate, Category, Priority
+from ..utils.logger import logger
+from ..utils.llm_clients import shared_llm, fast_llm
+from ..utils.llm_cache import cached_ainvoke, cached_structured_ainvoke, COMPETITOR_ANALYSIS_TTL
+from ..database.models import (
+    CompetitorUpdate, Category, Priority, CATEGORY_VALUES, PRIORITY_VALUES, CompetitorAnalysis, LandscapeAnalysis
+)
+
+# Upper bound on competitors searched/analyzed at the same time
+MAX_CONCURRENT_COMPETITORS = 5
+
+# Prompt templates, filled per call with str.format
+COMPETITOR_UPDATES_PROMPT = """
+Analyze the following search results about {competitor_name} competitor updates:
+
+Search Results:
+{search_results}
+
+Our Company Context:
+- Focus: {core_competencies}
+- Target industries: {target_industries}
+- Current offerings: {current_offerings}
+- Competitive advantages: {competitive_advantages}
+
+Provide analysis in JSON format:
+{{
+    "competitor_summary": "Brief overview of competitor's recent activities",
+    "updates": [
+        {{
+            "update_type": "product_launch|funding|partnership|acquisition|regulation",
+            "description": "Description of the update",
+            "impact_level": "low|medium|high|critical",
+            "source_url": "URL if available",
+            "strategic_implications": "How this affects our competitive position",
+            "suggested_response": "Recommended response strategy"
+        }}
+    ],
+    "competitive_threat_level": "low|medium|high|critical",
+    "key_differentiators": ["Areas where we still have advantages"],
+    "areas_of_concern": ["Areas where competitor is gaining advantage"],
+    "response_priority": "immediate|short-term|medium-term|long-term"
+}}
+
+Focus on developments that could impact our market position or create new competitive dynamics.
+"""
+
+LANDSCAPE_PROMPT = """
+Based on the following competitor digest, provide an overall competitive landscape assessment:
+
+Competitor Digest:
+{competitor_digest}
+
+Our Position:
+- Core competencies: {core_competencies}
+- Competitive advantages: {competitive_advantages}
+- Growth objectives: {growth_objectives}
+
+Cover market dynamics, emerging threats, opportunities created by competitive gaps, our
+current positioning, strategic priorities, and prioritized recommendations with timelines.
+"""
+
+DEEP_ANALYSIS_PROMPT = """
+Conduct a comprehensive competitive analysis of {competitor_name}:
+
+Recent Updates:
+{recent_updates}
+
+Product Information:
+{product_info}
+
+Analyze:
+1. Business model and revenue streams
+2. Product portfolio and key features
+3. Market positioning and messaging
+4. Pricing strategy and value proposition
+5. Strengths and vulnerabilities
+6. Strategic direction and likely next moves
+7. Competitive threats to our business
+8. Opportunities to compete more effectively
+
+Our context: {core_competencies}
+"""
 
 class CompetitorIntelligenceAgent:
     """Agent responsible for monitoring competitor activities"""
     
     def __init__(self):
-        self.llm = ChatOpenAI(
-            model="gpt-4",
-            temperature=0.1,
-            openai_api_key=os.getenv("OPENAI_API_KEY")
-        )
+        self.llm = shared_llm
+        self.llm_fast = fast_llm
         
         self.agent = Agent(
             role="Competitive Intelligence Analyst",
@@ -40,49 +115,44 @@ class CompetitorIntelligenceAgent:
     async def monitor_competitors(self) -> Dict[str, Any]:
         """Main method to monitor all competitors"""
         try:
-            competitors = COMPANY_CONTEXT.get("competitors", [])
+            # Normalize once: strip, drop blanks and collapse case-insensitive duplicates
+            # (keeping the first spelling and the configured order) so a repeated entry
+            # is not analyzed twice
+            unique_names = {}
+            for competitor in COMPANY_CONTEXT.get("competitors", []):
+                name = competitor.strip()
+                if name:
+                    unique_names.setdefault(name.lower(), name)
+            names = list(unique_names.values())
             all_updates = []
             competitor_analyses = {}
             
-            for competitor in competitors:
-                competitor_name = competitor.strip()
-                if not competitor_name:
+            # Competitors are independent, so process them concurrently; the semaphore
+            # caps in-flight Serper/OpenAI calls to stay inside their rate limits
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_COMPETITORS)
+            results = await asyncio.gather(
+                *(self._process_competitor(name, semaphore) for name in names),
+                return_exceptions=True
+            )
+            
+            digest = []
+            for competitor_name, result in zip(names, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error monitoring competitor {competitor_name}: {result}")
                     continue
-                    
-                # Search for recent updates about this competitor
-                updates = serper_tool.search_competitor_updates(competitor_name, days_back=30)
-                
-                # Analyze the competitor updates
-                analysis = await self._analyze_competitor_updates(competitor_name, updates)
+                analysis, stored_updates, digest_line = result
                 competitor_analyses[competitor_name] = analysis
-                
-                # Store updates in database
-                for update in analysis.get("updates", []):
-                    try:
-                        competitor_update = CompetitorUpdate(
-                            company_name=competitor_name,
-                            update_type=Category(update.get("update_type", "market_trend")),
-                            description=update.get("description", ""),
-                            impact_level=Priority(update.get("impact_level", "medium")),
-                            source_url=update.get("source_url"),
-                            detected_date=date.today()
-                        )
-                        
-                        stored_update = await db_client.insert_competitor_update(competitor_update.dict())
-                        if stored_update:
-                            all_updates.append(stored_update)
-                            
-                    except Exception as e:
-                        print(f"Error storing competitor update: {e}")
-                        continue
+                all_updates.extend(stored_updates)
+                digest.append(digest_line)
             
-            # Generate overall competitive landscape analysis
-            landscape_analysis = await self._analyze_competitive_landscape(competitor_analyses)
+            # Generate overall competitive landscape analysis from the digest; the full
+            # analyses are only kept for the returned result
+            landscape_analysis = await self._analyze_competitive_landscape("\n".join(digest))
             
             return {
                 "agent": "competitor_intelligence",
                 "timestamp": datetime.now().isoformat(),
-                "competitors_monitored": len(competitors),
+                "competitors_monitored": len(names),
                 "updates_found": len(all_updates),
                 "landscape_analysis": landscape_analysis,
                 "competitor_analyses": competitor_analyses,
@@ -91,7 +161,7 @@ class CompetitorIntelligenceAgent:
             }
             
         except Exception as e:
-            print(f"Error in competitor monitoring: {e}")
+            logger.exception(f"Error in competitor monitoring: {e}")
             return {
                 "agent": "competitor_intelligence",
                 "timestamp": datetime.now().isoformat(),
@@ -99,90 +169,78 @@ class CompetitorIntelligenceAgent:
                 "updates_found": 0
             }
     
-    async def _analyze_competitor_updates(self, competitor_name: str, search_results: str) -> Dict[str, Any]:
-        """Analyze updates for a specific competitor"""
-        analysis_prompt = f"""
-        Analyze the following search results about {competitor_name} competitor updates:
-        
-        Search Results:
-        {search_results}
-        
-        Our Company Context:
-        - Focus: {', '.join(COMPANY_CONTEXT['core_competencies'])}
-        - Target industries: {', '.join(COMPANY_CONTEXT['target_industries'])}
-        - Current offerings: {', '.join(COMPANY_CONTEXT['current_offerings'])}
-        - Competitive advantages: {', '.join(COMPANY_CONTEXT['competitive_advantages'])}
+    async def _process_competitor(self, competitor_name: str, semaphore: asyncio.Semaphore):
+        """Search, analyze and store updates for one competitor; returns (analysis, stored updates, digest line)"""
+        async with semaphore:
+            # Search for recent updates about this competitor
+            updates = await asyncio.to_thread(
+                serper_tool.search_competitor_updates, competitor_name, days_back=30
+            )
+            
+            # Analyze the competitor updates
+            analysis = await self._analyze_competitor_updates(competitor_name, updates)
         
-        Provide analysis in JSON format:
-        {{
-            "competitor_summary": "Brief overview of competitor's recent activities",
-            "updates": [
-                {{
-                    "update_type": "product_launch|funding|partnership|acquisition|regulation",
-                    "description": "Description of the update",
-                    "impact_level": "low|medium|high|critical",
-                    "source_url": "URL if available",
-                    "strategic_implications": "How this affects our competitive position",
-                    "suggested_response": "Recommended response strategy"
-                }}
-            ],
-            "competitive_threat_level": "low|medium|high|critical",
-            "key_differentiators": ["Areas where we still have advantages"],
-            "areas_of_concern": ["Areas where competitor is gaining advantage"],
-            "response_priority": "immediate|short-term|medium-term|long-term"
-        }}
+        # Map unexpected LLM labels to defaults instead of dropping the row and enforce the
+        # DB constraints (NOT NULL description, company_name length); the fields are then
+        # known-good, so build rows without re-validating and store them in one round trip
+        pending_rows = []
+        for update in analysis.get("updates", []):
+            description = (update.get("description") or "").strip()
+            if not description:
+                logger.warning(f"Skipping {competitor_name} update with no description")
+                continue
+            update_type = update.get("update_type") or "market_trend"
+            impact_level = update.get("impact_level") or "medium"
+            competitor_update = CompetitorUpdate.model_construct(
+                company_name=competitor_name[:255],
+                update_type=Category(update_type if update_type in CATEGORY_VALUES else "market_trend"),
+                description=description,
+                impact_level=Priority(impact_level if impact_level in PRIORITY_VALUES else "medium"),
+                source_url=update.get("source_url"),
+                detected_date=date.today()
+            )
+            pending_rows.append(competitor_update.model_dump(mode="json"))
         
-        Focus on developments that could impact our market position or create new competitive dynamics.
-        """
+        stored_updates = await db_client.insert_competitor_updates_bulk(pending_rows)
+        return analysis, stored_updates, self._digest_line(competitor_name, analysis)
+    
+    def _digest_line(self, competitor_name: str, analysis: Dict[str, Any]) -> str:
+        """One-line summary of a competitor analysis for the landscape prompt"""
+        headlines = "; ".join(update.get("description", "")[:200] for update in analysis.get("updates", [])[:3])
+        return (
+            f"{competitor_name}: threat={analysis.get('competitive_threat_level', 'unknown')}; "
+            f"summary={analysis.get('competitor_summary', '')[:300]}; updates={headlines or 'none'}"
+        )
+    
+    async def _analyze_competitor_updates(self, competitor_name: str, search_results: str) -> Dict[str, Any]:
+        """Analyze updates for a specific competitor"""
+        analysis_prompt = COMPETITOR_UPDATES_PROMPT.format(
+            competitor_name=competitor_name, search_results=compact_search_results(search_results),
+            **COMPANY_CONTEXT_STRINGS
+        )
         
         try:
-            response = self.llm.invoke(analysis_prompt)
-            return json.loads(response.content)
+            return await cached_structured_ainvoke(
+                self.llm_fast, CompetitorAnalysis, analysis_prompt, ttl=COMPETITOR_ANALYSIS_TTL
+            )
         except Exception as e:
-            print(f"Error analyzing competitor {competitor_name}: {e}")
+            logger.exception(f"Error analyzing competitor {competitor_name}: {e}")
             return {
                 "competitor_summary": f"Error analyzing {competitor_name}",
                 "updates": [],
                 "competitive_threat_level": "unknown"
             }
     
-    async def _analyze_competitive_landscape(self, competitor_analyses: Dict[str, Any]) -> Dict[str, Any]:
+    async def _analyze_competitive_landscape(self, competitor_digest: str) -> Dict[str, Any]:
         """Analyze the overall competitive landscape"""
-        landscape_prompt = f"""
-        Based on the following competitive analyses, provide an overall competitive landscape assessment:
-        
-        Competitor Analyses:
-        {json.dumps(competitor_analyses, indent=2)}
-        
-        Our Position:
-        - Core competencies: {', '.join(COMPANY_CONTEXT['core_competencies'])}
-        - Competitive advantages: {', '.join(COMPANY_CONTEXT['competitive_advantages'])}
-        - Growth objectives: {', '.join(COMPANY_CONTEXT['growth_objectives'])}
-        
-        Provide strategic analysis in JSON format:
-        {{
-            "landscape_summary": "Overall state of the competitive landscape",
-            "market_dynamics": "Key changes in market dynamics and competitive forces",
-            "emerging_threats": ["New competitive threats emerging"],
-            "market_opportunities": ["Opportunities created by competitive gaps"],
-            "competitive_positioning": "Assessment of our current competitive position",
-            "strategic_priorities": ["Top strategic priorities to maintain/improve position"],
-            "recommendations": [
-                {{
-                    "action": "Specific recommended action",
-                    "rationale": "Why this action is important",
-                    "priority": "high|medium|low",
-                    "timeline": "immediate|short-term|medium-term|long-term"
-                }}
-            ]
-        }}
-        """
+        landscape_prompt = LANDSCAPE_PROMPT.format(competitor_digest=competitor_digest, **COMPANY_CONTEXT_STRINGS)
         
         try:
-            response = self.llm.invoke(landscape_prompt)
-            return json.loads(response.content)
+            return await cached_structured_ainvoke(
+                self.llm, LandscapeAnalysis, landscape_prompt, ttl=COMPETITOR_ANALYSIS_TTL
+            )
         except Exception as e:
-            print(f"Error analyzing competitive landscape: {e}")
+            logger.exception(f"Error analyzing competitive landscape: {e}")
             return {
                 "landscape_summary": "Error in landscape analysis",
                 "recommendations": []
@@ -206,41 +264,30 @@ class CompetitorIntelligenceAgent:
     async def analyze_specific_competitor(self, competitor_name: str) -> Dict[str, Any]:
         """Deep dive analysis of a specific competitor"""
         try:
-            # Enhanced search for specific competitor
-            recent_updates = serper_tool.search_competitor_updates(competitor_name, days_back=90)
-            product_info = serper_tool._run(
-                f'"{competitor_name}" products services features pricing AI',
-                num_results=15,
-                time_range="m"
+            # Enhanced search for specific competitor; the blocking searches run
+            # in worker threads so they overlap instead of stalling the event loop
+            recent_updates, product_info = await asyncio.gather(
+                asyncio.to_thread(serper_tool.search_competitor_updates, competitor_name, days_back=90),
+                asyncio.to_thread(
+                    serper_tool._run,
+                    f'"{competitor_name}" products services features pricing AI',
+                    num_results=15,
+                    time_range="m"
+                )
             )
             
-            deep_analysis_prompt = f"""
-            Conduct a comprehensive competitive analysis of {competitor_name}:
-            
-            Recent Updates:
-            {recent_updates}
-            
-            Product Information:
-            {product_info}
-            
-            Analyze:
-            1. Business model and revenue streams
-            2. Product portfolio and key features
-            3. Market positioning and messaging
-            4. Pricing strategy and value proposition
-            5. Strengths and vulnerabilities
-            6. Strategic direction and likely next moves
-            7. Competitive threats to our business
-            8. Opportunities to compete more effectively
-            
-            Our context: {', '.join(COMPANY_CONTEXT['core_competencies'])}
-            """
+            deep_analysis_prompt = DEEP_ANALYSIS_PROMPT.format(
+                competitor_name=competitor_name,
+                recent_updates=compact_search_results(recent_updates),
+                product_info=compact_search_results(product_info),
+                **COMPANY_CONTEXT_STRINGS
+            )
             
-            response = self.llm.invoke(deep_analysis_prompt)
+            response_text = await cached_ainvoke(self.llm, deep_analysis_prompt, ttl=COMPETITOR_ANALYSIS_TTL)
             
             return {
                 "competitor": competitor_name,
-                "analysis": response.content,
+                "analysis": response_text,
                 "timestamp": datetime.now().isoformat()
             }
             
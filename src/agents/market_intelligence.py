@@ -2,26 +2,85 @@
 Market Intelligence Agent for competitive analysis
 """
 from crewai import Agent
-from langchain_openai import ChatOpenAI
 from typing import Dict, Any
-import os
+import asyncio
 from datetime import datetime, date
-import json
 
-from ..tools.serper_search import serper_tool
-from ..config.company_context import COMPANY_CONTEXT, ANALYSIS_PROMPTS
+from ..tools.serper_search import serper_tool, compact_search_results
+from ..config.company_context import COMPANY_CONTEXT, COMPANY_CONTEXT_STRINGS, ANALYSIS_PROMPTS
 from ..database.supabase_client import db_client
-from ..database.models import MarketFinding, Category
+from ..utils.logger import logger
+from ..utils.llm_clients import shared_llm, fast_llm
+from ..utils.llm_cache import cached_ainvoke, cached_structured_ainvoke, MARKET_NEWS_TTL
+from ..database.models import MarketFinding, Category, CATEGORY_VALUES, MarketFindings
+
+# Prompt templates, filled per call with str.format
+MARKET_ANALYSIS_PROMPT = """
+Based on the following market intelligence data, analyze and extract key findings:
+
+Recent AI News:
+{ai_news}
+
+Emerging Technologies:
+{emerging_tech}
+
+Funding News:
+{funding_news}
+
+Company Context:
+- Our focus: {core_competencies}
+- Target industries: {target_industries}
+- Current offerings: {current_offerings}
+
+Please provide a JSON response with the following structure:
+{{
+    "executive_summary": "Brief summary of key developments",
+    "findings": [
+        {{
+            "title": "Finding title",
+            "summary": "Brief summary",
+            "content": "Detailed analysis",
+            "category": "ai_research|product_launch|funding|regulation|market_trend",
+            "relevance_score": 0.85,
+            "source_url": "URL if available",
+            "implications": "Business implications"
+        }}
+    ],
+    "key_insights": ["List of key insights"],
+    "recommended_actions": ["List of recommended actions"]
+}}
+
+Rate relevance from 0.0 to 1.0 based on potential impact to our business model.
+Focus on developments that could create opportunities or pose threats.
+"""
+
+TOPIC_ANALYSIS_PROMPT = """
+Analyze the following information about "{topic}" in the context of the AI market:
+
+Search Results:
+{search_results}
+
+Additional Context:
+{context}
+
+Company Focus: {core_competencies}
+
+Provide analysis focusing on:
+1. Market size and growth potential
+2. Key players and competitive landscape
+3. Technology trends and innovations
+4. Business opportunities and threats
+5. Relevance to our business model
+
+Return a structured analysis with insights and recommendations.
+"""
 
 class MarketIntelligenceAgent:
     """Agent responsible for gathering and analyzing market intelligence"""
     
     def __init__(self):
-        self.llm = ChatOpenAI(
-            model="gpt-4",
-            temperature=0.1,
-            openai_api_key=os.getenv("OPENAI_API_KEY")
-        )
+        self.llm = shared_llm
+        self.llm_fast = fast_llm
         
         self.agent = Agent(
             role="AI Market Intelligence Specialist",
@@ -41,87 +100,62 @@ class MarketIntelligenceAgent:
     async def gather_market_intelligence(self) -> Dict[str, Any]:
         """Main method to gather and analyze market intelligence"""
         try:
-            # Search for recent AI industry developments
-            ai_news = serper_tool.search_ai_news(days_back=7)
-            emerging_tech = serper_tool._run(
-                "emerging AI technologies 2024 breakthrough innovation",
-                num_results=15,
-                time_range="m",
-                search_type="news"
-            )
-            funding_news = serper_tool._run(
-                "AI startup funding venture capital investment 2024",
-                num_results=10,
-                time_range="w",
-                search_type="news"
+            # Search for recent AI industry developments; the three searches are
+            # independent, so run them side by side in worker threads
+            ai_news, emerging_tech, funding_news = await asyncio.gather(
+                asyncio.to_thread(serper_tool.search_ai_news, days_back=7),
+                asyncio.to_thread(
+                    serper_tool._run,
+                    "emerging AI technologies 2024 breakthrough innovation",
+                    num_results=15,
+                    time_range="m",
+                    search_type="news"
+                ),
+                asyncio.to_thread(
+                    serper_tool._run,
+                    "AI startup funding venture capital investment 2024",
+                    num_results=10,
+                    time_range="w",
+                    search_type="news"
+                )
             )
             
             # Analyze the findings using OpenAI
-            analysis_prompt = f"""
-            Based on the following market intelligence data, analyze and extract key findings:
-            
-            Recent AI News:
-            {ai_news}
-            
-            Emerging Technologies:
-            {emerging_tech}
-            
-            Funding News:
-            {funding_news}
-            
-            Company Context:
-            - Our focus: {', '.join(COMPANY_CONTEXT['core_competencies'])}
-            - Target industries: {', '.join(COMPANY_CONTEXT['target_industries'])}
-            - Current offerings: {', '.join(COMPANY_CONTEXT['current_offerings'])}
-            
-            Please provide a JSON response with the following structure:
-            {{
-                "executive_summary": "Brief summary of key developments",
-                "findings": [
-                    {{
-                        "title": "Finding title",
-                        "summary": "Brief summary",
-                        "content": "Detailed analysis",
-                        "category": "ai_research|product_launch|funding|regulation|market_trend",
-                        "relevance_score": 0.85,
-                        "source_url": "URL if available",
-                        "implications": "Business implications"
-                    }}
-                ],
-                "key_insights": ["List of key insights"],
-                "recommended_actions": ["List of recommended actions"]
-            }}
-            
-            Rate relevance from 0.0 to 1.0 based on potential impact to our business model.
-            Focus on developments that could create opportunities or pose threats.
-            """
+            analysis_prompt = MARKET_ANALYSIS_PROMPT.format(
+                ai_news=compact_search_results(ai_news),
+                emerging_tech=compact_search_results(emerging_tech),
+                funding_news=compact_search_results(funding_news),
+                **COMPANY_CONTEXT_STRINGS
+            )
             
-            response = self.llm.invoke(analysis_prompt)
-            analysis = json.loads(response.content)
+            analysis = await cached_structured_ainvoke(
+                self.llm, MarketFindings, analysis_prompt, ttl=MARKET_NEWS_TTL
+            )
             
-            # Store findings in database
-            stored_findings = []
+            # The findings were already validated against MarketFindings, so coerce the
+            # remaining DB constraints here (NOT NULL text, lengths, score range) and build
+            # rows without a second validation pass; then store them all in one round trip
+            pending_rows = []
             for finding in analysis.get("findings", []):
-                try:
-                    # Create MarketFinding model
-                    market_finding = MarketFinding(
-                        date=date.today(),
-                        category=Category(finding.get("category", "market_trend")),
-                        title=finding.get("title", "")[:500],  # Truncate if too long
-                        summary=finding.get("summary", "")[:2000],
-                        content=finding.get("content", ""),
-                        relevance_score=float(finding.get("relevance_score", 0.0)),
-                        source_url=finding.get("source_url")
-                    )
-                    
-                    # Store in database
-                    stored_finding = await db_client.insert_market_finding(market_finding.dict())
-                    if stored_finding:
-                        stored_findings.append(stored_finding)
-                        
-                except Exception as e:
-                    print(f"Error storing finding: {e}")
+                title = (finding.get("title") or "").strip()
+                summary = (finding.get("summary") or "").strip()
+                content = (finding.get("content") or "").strip()
+                if not (title and summary and content):
+                    logger.warning(f"Skipping market finding with missing title, summary or content: {title!r}")
                     continue
+                category = finding.get("category") or "market_trend"
+                market_finding = MarketFinding.model_construct(
+                    date=date.today(),
+                    category=Category(category if category in CATEGORY_VALUES else "market_trend"),
+                    title=title[:500],  # Truncate if too long
+                    summary=summary[:2000],
+                    content=content,
+                    relevance_score=min(max(float(finding.get("relevance_score") or 0.0), 0.0), 1.0),
+                    source_url=finding.get("source_url")
+                )
+                pending_rows.append(market_finding.model_dump(mode="json"))
+            
+            stored_findings = await db_client.insert_market_findings_bulk(pending_rows)
             
             return {
                 "agent": "market_intelligence",
@@ -134,7 +168,7 @@ class MarketIntelligenceAgent:
             }
             
         except Exception as e:
-            print(f"Error in market intelligence gathering: {e}")
+            logger.exception(f"Error in market intelligence gathering: {e}")
             return {
                 "agent": "market_intelligence",
                 "timestamp": datetime.now().isoformat(),
@@ -145,39 +179,24 @@ class MarketIntelligenceAgent:
     async def analyze_specific_topic(self, topic: str, context: str = "") -> Dict[str, Any]:
         """Analyze a specific market topic in detail"""
         try:
-            # Search for topic-specific information
-            search_results = serper_tool._run(
+            # Search for topic-specific information off the event loop
+            search_results = await asyncio.to_thread(
+                serper_tool._run,
                 f"{topic} AI artificial intelligence market analysis 2024",
                 num_results=20,
                 time_range="m"
             )
             
-            analysis_prompt = f"""
-            Analyze the following information about "{topic}" in the context of the AI market:
-            
-            Search Results:
-            {search_results}
-            
-            Additional Context:
-            {context}
-            
-            Company Focus: {', '.join(COMPANY_CONTEXT['core_competencies'])}
-            
-            Provide analysis focusing on:
-            1. Market size and growth potential
-            2. Key players and competitive landscape
-            3. Technology trends and innovations
-            4. Business opportunities and threats
-            5. Relevance to our business model
-            
-            Return a structured analysis with insights and recommendations.
-            """
+            analysis_prompt = TOPIC_ANALYSIS_PROMPT.format(
+                topic=topic, search_results=compact_search_results(search_results), context=context,
+                **COMPANY_CONTEXT_STRINGS
+            )
             
-            response = self.llm.invoke(analysis_prompt)
+            response_text = await cached_ainvoke(self.llm_fast, analysis_prompt, ttl=MARKET_NEWS_TTL)
             
             return {
                 "topic": topic,
-                "analysis": response.content,
+                "analysis": response_text,
                 "timestamp": datetime.now().isoformat()
             }
             
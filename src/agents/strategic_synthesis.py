@@ -2,25 +2,23 @@
 Strategic Synthesis Agent for comprehensive analysis and recommendations
 """
 from crewai import Agent
-from langchain_openai import ChatOpenAI
 from typing import Dict, Any, List
-import os
 from datetime import datetime, date, timedelta
 import json
 
-from ..config.company_context import COMPANY_CONTEXT, ANALYSIS_PROMPTS
+from ..config.company_context import COMPANY_CONTEXT, COMPANY_CONTEXT_STRINGS, COMPANY_BLOCK, ANALYSIS_PROMPTS
 from ..database.supabase_client import db_client
-from ..database.models import Opportunity, Priority
+from ..utils.llm_clients import get_llm, fast_llm, SYNTHESIS_AGENT_MODEL
+from ..utils.llm_cache import cached_structured_ainvoke, STRATEGIC_SYNTHESIS_TTL
+from ..database.models import Opportunity, Priority, StrategicAnalysis, OpportunityIdeas
 
 class StrategicSynthesisAgent:
     """Agent responsible for synthesizing insights into strategic recommendations"""
     
     def __init__(self):
-        self.llm = ChatOpenAI(
-            model="gpt-o3",
-            temperature=0.1,
-            openai_api_key=os.getenv("OPENAI_API_KEY")
-        )
+        self.llm = get_llm(SYNTHESIS_AGENT_MODEL, 0.1)
+        # Free-form prose (briefings, portfolio review) doesn't need the synthesis model
+        self.llm_fast = fast_llm
         
         self.agent = Agent(
             role="Strategic Business Advisor",
@@ -40,15 +38,15 @@ class StrategicSynthesisAgent:
     async def generate_strategic_analysis(self) -> Dict[str, Any]:
         """Main method to synthesize all intelligence into strategic recommendations"""
         try:
-            # Gather all relevant data
+            # Gather all relevant data; limits match what the synthesis prompt embeds
             recent_findings = await db_client.get_market_findings(
-                limit=30,
+                limit=15,
                 start_date=(date.today() - timedelta(days=30))
             )
             
-            competitor_updates = await db_client.get_competitor_updates(limit=20)
-            current_trends = await db_client.get_trends(min_momentum=0.4, limit=15)
-            existing_opportunities = await db_client.get_opportunities(limit=10)
+            competitor_updates = await db_client.get_competitor_updates(limit=15)
+            current_trends = await db_client.get_trends(min_momentum=0.4, limit=10)
+            existing_opportunities = await db_client.get_opportunities(limit=5)
             
             # Generate comprehensive strategic analysis
             strategic_analysis = await self._synthesize_intelligence(
@@ -58,8 +56,8 @@ class StrategicSynthesisAgent:
             # Identify and score new opportunities
             new_opportunities = await self._identify_opportunities(strategic_analysis)
             
-            # Store new opportunities in database
-            stored_opportunities = []
+            # Validate new opportunities, then store them all in one round trip
+            pending_rows = []
             for opportunity in new_opportunities:
                 try:
                     opp_model = Opportunity(
@@ -72,15 +70,14 @@ class StrategicSynthesisAgent:
                         implementation_complexity=opportunity.get("implementation_complexity"),
                         time_to_market=opportunity.get("time_to_market")
                     )
-                    
-                    stored_opp = await db_client.insert_opportunity(opp_model.dict())
-                    if stored_opp:
-                        stored_opportunities.append(stored_opp)
+                    pending_rows.append(opp_model.model_dump(mode="json"))
                         
                 except Exception as e:
-                    print(f"Error storing opportunity: {e}")
+                    print(f"Error preparing opportunity: {e}")
                     continue
             
+            stored_opportunities = await db_client.insert_opportunities_bulk(pending_rows)
+            
             return {
                 "agent": "strategic_synthesis",
                 "timestamp": datetime.now().isoformat(),
@@ -110,28 +107,20 @@ class StrategicSynthesisAgent:
                                      existing_opportunities: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Synthesize all intelligence data into strategic insights"""
         
-        synthesis_prompt = f"""
+        synthesis_prompt = f"""{COMPANY_BLOCK}
         As a strategic advisor, synthesize the following intelligence data into actionable strategic insights:
         
         MARKET INTELLIGENCE (Last 30 days):
-        {json.dumps(market_findings[:15], indent=2, default=str)}
+        {json.dumps(market_findings[:15], separators=(',', ':'), default=str)}
         
         COMPETITOR UPDATES:
-        {json.dumps(competitor_updates[:15], indent=2, default=str)}
+        {json.dumps(competitor_updates[:15], separators=(',', ':'), default=str)}
         
         MARKET TRENDS:
-        {json.dumps(trends[:10], indent=2, default=str)}
+        {json.dumps(trends[:10], separators=(',', ':'), default=str)}
         
         EXISTING OPPORTUNITIES:
-        {json.dumps(existing_opportunities[:5], indent=2, default=str)}
-        
-        COMPANY CONTEXT:
-        - Name: {COMPANY_CONTEXT['name']}
-        - Core competencies: {', '.join(COMPANY_CONTEXT['core_competencies'])}
-        - Target industries: {', '.join(COMPANY_CONTEXT['target_industries'])}
-        - Competitive advantages: {', '.join(COMPANY_CONTEXT['competitive_advantages'])}
-        - Growth objectives: {', '.join(COMPANY_CONTEXT['growth_objectives'])}
-        - Current offerings: {', '.join(COMPANY_CONTEXT['current_offerings'])}
+        {json.dumps(existing_opportunities[:5], separators=(',', ':'), default=str)}
         
         Provide strategic analysis in JSON format:
         {{
@@ -184,8 +173,9 @@ class StrategicSynthesisAgent:
         """
         
         try:
-            response = self.llm.invoke(synthesis_prompt)
-            return json.loads(response.content)
+            return await cached_structured_ainvoke(
+                self.llm, StrategicAnalysis, synthesis_prompt, ttl=STRATEGIC_SYNTHESIS_TTL
+            )
         except Exception as e:
             print(f"Error in intelligence synthesis: {e}")
             return {
@@ -197,16 +187,11 @@ class StrategicSynthesisAgent:
     async def _identify_opportunities(self, strategic_analysis: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Identify specific business opportunities based on strategic analysis"""
         
-        opportunity_prompt = f"""
+        opportunity_prompt = f"""{COMPANY_BLOCK}
         Based on the strategic analysis, identify specific, actionable business opportunities:
         
         Strategic Analysis:
-        {json.dumps(strategic_analysis, indent=2)}
-        
-        Company Capabilities:
-        - Core competencies: {', '.join(COMPANY_CONTEXT['core_competencies'])}
-        - Competitive advantages: {', '.join(COMPANY_CONTEXT['competitive_advantages'])}
-        - Current offerings: {', '.join(COMPANY_CONTEXT['current_offerings'])}
+        {json.dumps(strategic_analysis, separators=(',', ':'), default=str)}
         
         Identify opportunities and provide detailed analysis in JSON format:
         {{
@@ -240,8 +225,9 @@ class StrategicSynthesisAgent:
         """
         
         try:
-            response = self.llm.invoke(opportunity_prompt)
-            result = json.loads(response.content)
+            result = await cached_structured_ainvoke(
+                self.llm, OpportunityIdeas, opportunity_prompt, ttl=STRATEGIC_SYNTHESIS_TTL
+            )
             return result.get("opportunities", [])
         except Exception as e:
             print(f"Error identifying opportunities: {e}")
@@ -260,16 +246,16 @@ class StrategicSynthesisAgent:
             Create an executive briefing for the leadership team:
             
             ANALYSIS SUMMARY (Last 30 days):
-            {json.dumps(analysis_summary, indent=2)}
+            {json.dumps(analysis_summary, separators=(',', ':'), default=str)}
             
             TOP OPPORTUNITIES:
-            {json.dumps(top_opportunities, indent=2, default=str)}
+            {json.dumps(top_opportunities, separators=(',', ':'), default=str)}
             
             CRITICAL TRENDS:
-            {json.dumps(critical_trends, indent=2, default=str)}
+            {json.dumps(critical_trends, separators=(',', ':'), default=str)}
             
             RECENT COMPETITIVE DEVELOPMENTS:
-            {json.dumps(recent_threats, indent=2, default=str)}
+            {json.dumps(recent_threats, separators=(',', ':'), default=str)}
             
             Create a concise executive briefing covering:
             1. Key strategic insights (3-4 bullet points)
@@ -282,7 +268,7 @@ class StrategicSynthesisAgent:
             Company: {COMPANY_CONTEXT['name']}
             """
             
-            response = self.llm.invoke(briefing_prompt)
+            response = await self.llm_fast.ainvoke(briefing_prompt)
             
             return {
                 "briefing_type": "executive",
@@ -311,11 +297,11 @@ class StrategicSynthesisAgent:
             Assess our current opportunity portfolio for strategic balance and prioritization:
             
             All Opportunities:
-            {json.dumps(all_opportunities, indent=2, default=str)}
+            {json.dumps(all_opportunities, separators=(',', ':'), default=str)}
             
             Company Resources and Focus:
-            - Core competencies: {', '.join(COMPANY_CONTEXT['core_competencies'])}
-            - Growth objectives: {', '.join(COMPANY_CONTEXT['growth_objectives'])}
+            - Core competencies: {COMPANY_CONTEXT_STRINGS['core_competencies']}
+            - Growth objectives: {COMPANY_CONTEXT_STRINGS['growth_objectives']}
             
             Provide portfolio analysis covering:
             1. Portfolio balance (short vs long-term, risk levels, market segments)
@@ -326,7 +312,7 @@ class StrategicSynthesisAgent:
             6. Recommendations for portfolio optimization
             """
             
-            response = self.llm.invoke(portfolio_prompt)
+            response = await self.llm_fast.ainvoke(portfolio_prompt)
             
             return {
                 "analysis_type": "opportunity_portfolio",
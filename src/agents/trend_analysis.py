@@ -2,26 +2,25 @@
 Trend Analysis Agent for pattern recognition and forecasting
 """
 from crewai import Agent
-from langchain_openai import ChatOpenAI
 from typing import Dict, Any, List
-import os
+import asyncio
 from datetime import datetime, date, timedelta
 import json
 
 from ..tools.serper_search import serper_tool
-from ..config.company_context import COMPANY_CONTEXT, ANALYSIS_PROMPTS
+from ..config.company_context import COMPANY_CONTEXT, COMPANY_CONTEXT_STRINGS, COMPANY_BLOCK, ANALYSIS_PROMPTS
 from ..database.supabase_client import db_client
-from ..database.models import Trend, Category
+from ..utils.llm_clients import get_llm, SYNTHESIS_AGENT_MODEL, FAST_AGENT_MODEL
+from ..utils.llm_cache import cached_structured_ainvoke, MARKET_NEWS_TTL
+from ..database.models import Trend, Category, TrendPatternAnalysis
 
 class TrendAnalysisAgent:
     """Agent responsible for identifying and analyzing market trends"""
     
     def __init__(self):
-        self.llm = ChatOpenAI(
-            model="gpt-o3",
-            temperature=0.2,
-            openai_api_key=os.getenv("OPENAI_API_KEY")
-        )
+        self.llm = get_llm(SYNTHESIS_AGENT_MODEL, 0.2)
+        # Free-form prose (convergence, forecasts) doesn't need the synthesis model
+        self.llm_fast = get_llm(FAST_AGENT_MODEL, 0.2)
         
         self.agent = Agent(
             role="Market Trend Forecasting Analyst",
@@ -41,13 +40,13 @@ class TrendAnalysisAgent:
     async def analyze_market_trends(self) -> Dict[str, Any]:
         """Main method to analyze current and emerging market trends"""
         try:
-            # Get historical data for pattern analysis
+            # Get historical data for pattern analysis; limits match what the prompt embeds
             historical_findings = await db_client.get_market_findings(
-                limit=100,
+                limit=20,
                 start_date=(date.today() - timedelta(days=180))
             )
             
-            historical_opportunities = await db_client.get_opportunities(limit=50)
+            historical_opportunities = await db_client.get_opportunities(limit=10)
             
             # Search for current trend indicators
             current_trends = await self._search_current_trends()
@@ -59,8 +58,8 @@ class TrendAnalysisAgent:
                 current_trends
             )
             
-            # Store identified trends in database
-            stored_trends = []
+            # Validate identified trends, then store them all in one round trip
+            pending_rows = []
             for trend in trend_analysis.get("trends", []):
                 try:
                     trend_model = Trend(
@@ -71,15 +70,14 @@ class TrendAnalysisAgent:
                         first_detected=date.today(),
                         prediction=trend.get("prediction", "")
                     )
-                    
-                    stored_trend = await db_client.insert_trend(trend_model.dict())
-                    if stored_trend:
-                        stored_trends.append(stored_trend)
+                    pending_rows.append(trend_model.model_dump(mode="json"))
                         
                 except Exception as e:
-                    print(f"Error storing trend: {e}")
+                    print(f"Error preparing trend: {e}")
                     continue
             
+            stored_trends = await db_client.insert_trends_bulk(pending_rows)
+            
             return {
                 "agent": "trend_analysis",
                 "timestamp": datetime.now().isoformat(),
@@ -102,32 +100,22 @@ class TrendAnalysisAgent:
     
     async def _search_current_trends(self) -> Dict[str, str]:
         """Search for current market trend indicators"""
-        trend_searches = {
-            "ai_technology": serper_tool._run(
-                "AI technology trends 2024 emerging artificial intelligence",
-                num_results=15,
-                time_range="m",
-                search_type="news"
-            ),
-            "enterprise_adoption": serper_tool._run(
-                "enterprise AI adoption trends business automation 2024",
-                num_results=12,
-                time_range="m"
-            ),
-            "investment_trends": serper_tool._run(
-                "AI investment trends venture capital funding 2024",
-                num_results=10,
-                time_range="m",
-                search_type="news"
-            ),
-            "regulatory_trends": serper_tool._run(
-                "AI regulation policy trends government artificial intelligence",
-                num_results=10,
-                time_range="m"
-            )
+        # (query, num_results, search_type) per indicator; the searches are independent,
+        # so they run side by side in worker threads
+        trend_queries = {
+            "ai_technology": ("AI technology trends 2024 emerging artificial intelligence", 15, "news"),
+            "enterprise_adoption": ("enterprise AI adoption trends business automation 2024", 12, "search"),
+            "investment_trends": ("AI investment trends venture capital funding 2024", 10, "news"),
+            "regulatory_trends": ("AI regulation policy trends government artificial intelligence", 10, "search")
         }
+        results = await asyncio.gather(*(
+            asyncio.to_thread(
+                serper_tool._run, query, num_results=num_results, time_range="m", search_type=search_type
+            )
+            for query, num_results, search_type in trend_queries.values()
+        ))
         
-        return trend_searches
+        return dict(zip(trend_queries, results))
     
     async def _analyze_trend_patterns(self, 
                                     historical_findings: List[Dict[str, Any]], 
@@ -135,22 +123,17 @@ class TrendAnalysisAgent:
                                     current_trends: Dict[str, str]) -> Dict[str, Any]:
         """Analyze patterns to identify and validate trends"""
         
-        analysis_prompt = f"""
+        analysis_prompt = f"""{COMPANY_BLOCK}
         Analyze the following data to identify market trends and patterns:
         
         Historical Market Findings (last 6 months):
-        {json.dumps(historical_findings[:20], indent=2, default=str)}
+        {json.dumps(historical_findings[:20], separators=(',', ':'), default=str)}
         
         Historical Opportunities:
-        {json.dumps(historical_opportunities[:10], indent=2, default=str)}
+        {json.dumps(historical_opportunities[:10], separators=(',', ':'), default=str)}
         
         Current Trend Searches:
-        {json.dumps(current_trends, indent=2)}
-        
-        Company Context:
-        - Focus areas: {', '.join(COMPANY_CONTEXT['core_competencies'])}
-        - Target industries: {', '.join(COMPANY_CONTEXT['target_industries'])}
-        - Growth objectives: {', '.join(COMPANY_CONTEXT['growth_objectives'])}
+        {json.dumps(current_trends, separators=(',', ':'), default=str)}
         
         Identify trends and provide analysis in JSON format:
         {{
@@ -193,8 +176,10 @@ class TrendAnalysisAgent:
         """
         
         try:
-            response = self.llm.invoke(analysis_prompt)
-            return json.loads(response.content)
+            # The prompt embeds this month's trend searches, so it shares the market news TTL
+            return await cached_structured_ainvoke(
+                self.llm, TrendPatternAnalysis, analysis_prompt, ttl=MARKET_NEWS_TTL
+            )
         except Exception as e:
             print(f"Error in trend pattern analysis: {e}")
             return {
@@ -212,9 +197,9 @@ class TrendAnalysisAgent:
             Analyze potential trend convergences that could create new opportunities:
             
             Recent Trends:
-            {json.dumps(recent_trends, indent=2, default=str)}
+            {json.dumps(recent_trends, separators=(',', ':'), default=str)}
             
-            Our Capabilities: {', '.join(COMPANY_CONTEXT['core_competencies'])}
+            Our Capabilities: {COMPANY_CONTEXT_STRINGS['core_competencies']}
             
             Identify:
             1. Trends that are converging or reinforcing each other
@@ -226,7 +211,7 @@ class TrendAnalysisAgent:
             Focus on convergences relevant to our business model and capabilities.
             """
             
-            response = self.llm.invoke(convergence_prompt)
+            response = await self.llm_fast.ainvoke(convergence_prompt)
             
             return {
                 "analysis_type": "trend_convergence",
@@ -247,7 +232,7 @@ class TrendAnalysisAgent:
             # Get comprehensive trend data
             trends = await db_client.get_trends(min_momentum=0.5, limit=15)
             market_findings = await db_client.get_market_findings(
-                limit=50,
+                limit=15,
                 start_date=(date.today() - timedelta(days=90))
             )
             
@@ -255,10 +240,10 @@ class TrendAnalysisAgent:
             Based on trend analysis and market data, provide market direction forecasts:
             
             High-Momentum Trends:
-            {json.dumps(trends, indent=2, default=str)}
+            {json.dumps(trends, separators=(',', ':'), default=str)}
             
             Recent Market Findings:
-            {json.dumps(market_findings[:15], indent=2, default=str)}
+            {json.dumps(market_findings[:15], separators=(',', ':'), default=str)}
             
             Forecast for next {timeframe}:
             
@@ -269,13 +254,13 @@ class TrendAnalysisAgent:
             5. Regulatory environment changes
             6. Customer behavior and demand shifts
             
-            Company Context: {', '.join(COMPANY_CONTEXT['focus_keywords'])}
-            Target Industries: {', '.join(COMPANY_CONTEXT['target_industries'])}
+            Company Context: {COMPANY_CONTEXT_STRINGS['focus_keywords']}
+            Target Industries: {COMPANY_CONTEXT_STRINGS['target_industries']}
             
             Provide specific, actionable forecasts with confidence levels.
             """
             
-            response = self.llm.invoke(forecast_prompt)
+            response = await self.llm_fast.ainvoke(forecast_prompt)
             
             return {
                 "forecast_timeframe": timeframe,
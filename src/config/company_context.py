@@ -2,6 +2,7 @@
 Company context configuration for competitive analysis
 """
 import os
+from types import MappingProxyType
 from typing import Dict, List, Any
 from dotenv import load_dotenv
 
@@ -128,6 +129,22 @@ def get_analysis_prompts() -> Dict[str, str]:
         """
     }
 
-# Global context instance
-COMPANY_CONTEXT = get_company_context()
-ANALYSIS_PROMPTS = get_analysis_prompts()
\ No newline at end of file
+# Global context instance; read-only so the joined strings below cannot go stale
+COMPANY_CONTEXT = MappingProxyType(get_company_context())
+ANALYSIS_PROMPTS = get_analysis_prompts()
+
+# List-valued context fields pre-joined for prompt interpolation
+COMPANY_CONTEXT_STRINGS = MappingProxyType({
+    key: ', '.join(value) for key, value in COMPANY_CONTEXT.items() if isinstance(value, list)
+})
+
+# Full company section shared by the data-heavy prompts; keeping it first gives them an identical prefix
+COMPANY_BLOCK = f"""COMPANY CONTEXT:
+- Name: {COMPANY_CONTEXT['name']}
+- Industry: {COMPANY_CONTEXT['industry']}
+- Core competencies: {COMPANY_CONTEXT_STRINGS['core_competencies']}
+- Target industries: {COMPANY_CONTEXT_STRINGS['target_industries']}
+- Competitive advantages: {COMPANY_CONTEXT_STRINGS['competitive_advantages']}
+- Growth objectives: {COMPANY_CONTEXT_STRINGS['growth_objectives']}
+- Current offerings: {COMPANY_CONTEXT_STRINGS['current_offerings']}
+"""
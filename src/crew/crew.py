@@ -167,7 +167,7 @@ class CompetitiveAnalysisCrew:
                 status=results["status"]
             )
             
-            await db_client.insert_analysis_run(analysis_run.dict())
+            await db_client.insert_analysis_run(analysis_run.model_dump(mode="json"))
             print("📊 Analysis run stored in database")
             
         except Exception as e:
@@ -3,7 +3,7 @@ Database models and schema definitions for competitive analysis
 """
 from typing import Dict, List, Optional, Any
 from datetime import datetime, date
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
 class Priority(str, Enum):
@@ -22,8 +22,14 @@ class Category(str, Enum):
     TECHNOLOGY = "technology"
     MARKET_TREND = "market_trend"
 
+# Valid enum values, for mapping free-form LLM labels without raising
+CATEGORY_VALUES = frozenset(member.value for member in Category)
+PRIORITY_VALUES = frozenset(member.value for member in Priority)
+
 class MarketFinding(BaseModel):
     """Model for market intelligence findings"""
+    model_config = ConfigDict(frozen=True)
+    
     id: Optional[str] = None
     date: date = Field(default_factory=date.today)
     category: Category
@@ -36,6 +42,8 @@ class MarketFinding(BaseModel):
 
 class CompetitorUpdate(BaseModel):
     """Model for competitor intelligence updates"""
+    model_config = ConfigDict(frozen=True)
+    
     id: Optional[str] = None
     company_name: str = Field(max_length=255)
     update_type: Category
@@ -81,6 +89,150 @@ class AnalysisRun(BaseModel):
     status: str = "completed"
     created_at: Optional[datetime] = None
 
+# Structured LLM response schemas used by the agents
+class CompetitorUpdateItem(BaseModel):
+    """One competitor development extracted from search results"""
+    update_type: str = Field(description="product_launch|funding|partnership|acquisition|regulation")
+    description: str
+    impact_level: str = Field(description="low|medium|high|critical")
+    source_url: Optional[str] = None
+    strategic_implications: str
+    suggested_response: str
+
+class CompetitorAnalysis(BaseModel):
+    """LLM analysis of one competitor's recent updates"""
+    competitor_summary: str
+    updates: List[CompetitorUpdateItem]
+    competitive_threat_level: str = Field(description="low|medium|high|critical")
+    key_differentiators: List[str]
+    areas_of_concern: List[str]
+    response_priority: str = Field(description="immediate|short-term|medium-term|long-term")
+
+class StrategicRecommendation(BaseModel):
+    """A recommended action from the landscape analysis"""
+    action: str
+    rationale: str
+    priority: str = Field(description="high|medium|low")
+    timeline: str = Field(description="immediate|short-term|medium-term|long-term")
+
+class LandscapeAnalysis(BaseModel):
+    """LLM assessment of the overall competitive landscape"""
+    landscape_summary: str
+    market_dynamics: str
+    emerging_threats: List[str]
+    market_opportunities: List[str]
+    competitive_positioning: str
+    strategic_priorities: List[str]
+    recommendations: List[StrategicRecommendation]
+
+class MarketFindingItem(BaseModel):
+    """One market development extracted from search results"""
+    title: str
+    summary: str
+    content: str
+    category: str = Field(description="ai_research|product_launch|funding|regulation|market_trend")
+    relevance_score: float = Field(description="0.0 to 1.0 relevance to our business")
+    source_url: Optional[str] = None
+    implications: str
+
+class MarketFindings(BaseModel):
+    """LLM analysis of the latest market intelligence"""
+    executive_summary: str
+    findings: List[MarketFindingItem]
+    key_insights: List[str]
+    recommended_actions: List[str]
+
+class OpportunityTheme(BaseModel):
+    """A major opportunity theme from the strategic synthesis"""
+    theme: str
+    description: str
+    market_drivers: List[str]
+    alignment_score: float = Field(description="0.0 to 1.0 alignment with our capabilities")
+    potential_impact: str = Field(description="high|medium|low")
+
+class SynthesisRecommendation(StrategicRecommendation):
+    """A strategic recommendation with its resourcing and expected outcome"""
+    resources_required: str
+    expected_outcome: str
+
+class StrategicRisk(BaseModel):
+    """A strategic risk and how to mitigate it"""
+    risk: str
+    impact: str = Field(description="high|medium|low")
+    probability: str = Field(description="high|medium|low")
+    mitigation: str
+
+class ActionPhase(BaseModel):
+    """One phase of the strategic action plan"""
+    phase: str
+    actions: List[str]
+    timeline: str
+    success_metrics: List[str]
+
+class StrategicAnalysis(BaseModel):
+    """LLM synthesis of all intelligence into strategic insights"""
+    executive_summary: str = Field(description="3-4 sentence summary of key strategic insights")
+    strategic_insights: List[str]
+    market_dynamics: str
+    competitive_positioning: str
+    opportunity_themes: List[OpportunityTheme]
+    recommendations: List[SynthesisRecommendation]
+    risk_assessment: List[StrategicRisk]
+    action_plan: List[ActionPhase]
+
+class OpportunityItem(BaseModel):
+    """One business opportunity identified from the strategic analysis"""
+    title: str = Field(description="Opportunity title (max 255 chars)")
+    description: str
+    market_gap: str
+    score: float = Field(description="0.0 to 1.0 opportunity score")
+    priority: str = Field(description="high|medium|low")
+    potential_revenue: Optional[str] = None
+    implementation_complexity: Optional[str] = Field(default=None, description="low|medium|high")
+    time_to_market: Optional[str] = None
+    strategic_rationale: str
+    market_validation: str
+    competitive_advantage: str
+    key_success_factors: List[str]
+    risks_and_challenges: List[str]
+
+class OpportunityIdeas(BaseModel):
+    """LLM list of specific business opportunities"""
+    opportunities: List[OpportunityItem]
+
+class TrendEvidence(BaseModel):
+    """Evidence supporting an identified trend"""
+    frequency_mentions: int
+    growth_indicators: List[str]
+    supporting_data: List[str]
+    time_span: str
+
+class TrendItem(BaseModel):
+    """One market trend identified from historical and current data"""
+    trend_name: str
+    category: str = Field(description="ai_research|technology|market_trend|regulation|funding")
+    momentum_score: float = Field(description="0.0 to 1.0 trend strength and growth trajectory")
+    evidence: TrendEvidence
+    prediction: str
+    business_relevance: str
+    opportunity_potential: str
+
+class TrendPrediction(BaseModel):
+    """A dated market prediction"""
+    timeframe: str = Field(description="3-6 months|6-12 months|1-2 years")
+    prediction: str
+    confidence: float
+    impact_level: str = Field(description="low|medium|high")
+
+class TrendPatternAnalysis(BaseModel):
+    """LLM analysis of market trends and patterns"""
+    summary: str
+    trends: List[TrendItem]
+    predictions: List[TrendPrediction]
+    opportunity_indicators: List[str]
+    risk_factors: List[str]
+    cross_trend_analysis: str
+
 # Database schema creation SQL
 DATABASE_SCHEMA = """
 -- Market findings table
@@ -91,7 +243,7 @@ CREATE TABLE IF NOT EXISTS market_findings (
     title TEXT NOT NULL,
     summary TEXT NOT NULL,
     content TEXT NOT NULL,
-    relevance_score DECIMAL(3,2) NOT NULL CHECK (relevance_score >= 0 AND relevance_score <= 1),
+    relevance_score REAL NOT NULL CHECK (relevance_score >= 0 AND relevance_score <= 1),
     source_url TEXT,
     created_at TIMESTAMP DEFAULT NOW()
 );
@@ -114,7 +266,7 @@ CREATE TABLE IF NOT EXISTS opportunities (
     title VARCHAR(255) NOT NULL,
     description TEXT NOT NULL,
     market_gap TEXT NOT NULL,
-    score DECIMAL(3,2) NOT NULL CHECK (score >= 0 AND score <= 1),
+    score REAL NOT NULL CHECK (score >= 0 AND score <= 1),
     priority VARCHAR(20) NOT NULL,
     potential_revenue VARCHAR(50),
     implementation_complexity VARCHAR(50),
@@ -127,8 +279,8 @@ CREATE TABLE IF NOT EXISTS trends (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
     trend_name VARCHAR(255) NOT NULL,
     category VARCHAR(50) NOT NULL,
-    momentum_score DECIMAL(3,2) NOT NULL CHECK (momentum_score >= 0 AND momentum_score <= 1),
-    evidence JSON,
+    momentum_score REAL NOT NULL CHECK (momentum_score >= 0 AND momentum_score <= 1),
+    evidence JSONB,
     first_detected DATE NOT NULL,
     prediction TEXT,
     created_at TIMESTAMP DEFAULT NOW()
@@ -141,18 +293,21 @@ CREATE TABLE IF NOT EXISTS analysis_runs (
     findings_count INTEGER DEFAULT 0,
     opportunities_identified INTEGER DEFAULT 0,
     key_insights TEXT,
-    recommendations JSON,
-    execution_time_seconds DECIMAL(8,2),
+    recommendations JSONB,
+    execution_time_seconds REAL,
     status VARCHAR(20) DEFAULT 'completed',
     created_at TIMESTAMP DEFAULT NOW()
 );
 
 -- Create indexes for better query performance
 CREATE INDEX IF NOT EXISTS idx_market_findings_date ON market_findings(date DESC);
-CREATE INDEX IF NOT EXISTS idx_market_findings_category ON market_findings(category);
-CREATE INDEX IF NOT EXISTS idx_competitor_updates_company ON competitor_updates(company_name);
+CREATE INDEX IF NOT EXISTS idx_market_findings_category_date ON market_findings(category, date DESC);
+CREATE INDEX IF NOT EXISTS idx_market_findings_category_relevance ON market_findings(category, relevance_score DESC) INCLUDE (title);
+CREATE INDEX IF NOT EXISTS idx_competitor_updates_company_date ON competitor_updates(company_name, detected_date DESC);
 CREATE INDEX IF NOT EXISTS idx_opportunities_score ON opportunities(score DESC);
 CREATE INDEX IF NOT EXISTS idx_trends_momentum ON trends(momentum_score DESC);
+CREATE INDEX IF NOT EXISTS idx_trends_evidence_gin ON trends USING GIN (evidence);
+CREATE INDEX IF NOT EXISTS idx_analysis_runs_recommendations_gin ON analysis_runs USING GIN (recommendations);
 """
 
 def get_sample_data() -> Dict[str, List[Dict[str, Any]]]:
@@ -2,6 +2,7 @@
 Supabase client for competitive analysis data management
 """
 import os
+import logging
 from typing import Dict, List, Optional, Any
 from datetime import datetime, date
 import json
@@ -10,6 +11,10 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# The project logger by name: this module is also imported as top-level `database.supabase_client`,
+# where a relative import of ..utils.logger would fail
+_log = logging.getLogger("competitive_analysis")
+
 class SupabaseClient:
     """Handles all database operations for the competitive analysis system"""
     
@@ -22,6 +27,25 @@ class SupabaseClient:
         
         self.client: Client = create_client(self.url, self.key)
     
+    def _insert_rows(self, table: str, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Insert rows in one request; if it is rejected, retry row by row so one bad row only loses itself"""
+        if not rows:
+            return []
+        try:
+            result = self.client.table(table).insert(rows).execute()
+            return result.data or []
+        except Exception as e:
+            _log.warning(f"Bulk insert into {table} failed, retrying {len(rows)} rows one at a time: {e}")
+        
+        inserted = []
+        for row in rows:
+            try:
+                result = self.client.table(table).insert(row).execute()
+                inserted.extend(result.data or [])
+            except Exception as e:
+                _log.error(f"Error inserting row into {table}: {e}")
+        return inserted
+    
     # Market Findings Operations
     async def insert_market_finding(self, finding: Dict[str, Any]) -> Dict[str, Any]:
         """Insert a new market finding"""
@@ -32,6 +56,10 @@ class SupabaseClient:
             print(f"Error inserting market finding: {e}")
             return None
     
+    async def insert_market_findings_bulk(self, findings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Insert several market findings in one request"""
+        return self._insert_rows("market_findings", findings)
+    
     async def get_market_findings(self, 
                                 limit: int = 50,
                                 category: Optional[str] = None,
@@ -61,6 +89,10 @@ class SupabaseClient:
             print(f"Error inserting competitor update: {e}")
             return None
     
+    async def insert_competitor_updates_bulk(self, updates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Insert several competitor updates in one request"""
+        return self._insert_rows("competitor_updates", updates)
+    
     async def get_competitor_updates(self, 
                                    company_name: Optional[str] = None,
                                    limit: int = 50) -> List[Dict[str, Any]]:
@@ -87,6 +119,10 @@ class SupabaseClient:
             print(f"Error inserting opportunity: {e}")
             return None
     
+    async def insert_opportunities_bulk(self, opportunities: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Insert several opportunities in one request"""
+        return self._insert_rows("opportunities", opportunities)
+    
     async def get_opportunities(self, 
                               min_score: Optional[float] = None,
                               limit: int = 50) -> List[Dict[str, Any]]:
@@ -113,6 +149,10 @@ class SupabaseClient:
             print(f"Error inserting trend: {e}")
             return None
     
+    async def insert_trends_bulk(self, trends: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Insert several trends in one request"""
+        return self._insert_rows("trends", trends)
+    
     async def get_trends(self, 
                         category: Optional[str] = None,
                         min_momentum: Optional[float] = None,
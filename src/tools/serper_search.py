@@ -2,13 +2,91 @@
 Serper API integration for intelligent web search
 """
 import os
+import re
+import time
+import hashlib
+import logging
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from collections import OrderedDict
+from concurrent.futures import Future
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 import json
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
+try:
+    import redis
+except ImportError:  # Redis is optional; searches are still cached in-process
+    redis = None
+
+SERPER_BASE_URL = "https://google.serper.dev"
+
+# Shared keep-alive session: concurrent searches reuse pooled TLS connections
+# to google.serper.dev instead of opening a new handshake per request
+_session = requests.Session()
+_session.mount(SERPER_BASE_URL, HTTPAdapter(pool_connections=1, pool_maxsize=16))
+
+# Search results are cached by query hash for an hour; expiry is the only invalidation
+SEARCH_CACHE_TTL = 3600
+SEARCH_CACHE_MAX_ENTRIES = 512
+_search_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_search_cache_lock = threading.Lock()  # searches run from worker threads
+# Searches currently being fetched, so concurrent identical queries share one HTTP request
+_inflight_searches: Dict[str, Future] = {}
+_redis = None
+if redis is not None and os.getenv("REDIS_URL"):
+    _redis = redis.Redis.from_url(os.environ["REDIS_URL"], decode_responses=True)
+_log = logging.getLogger("competitive_analysis")
+
+def _search_cache_key(query: str, num_results: int, time_range: str, search_type: str) -> str:
+    """Cache key for one Serper request"""
+    raw = json.dumps([query, num_results, time_range, search_type])
+    return "serper:" + hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+def _cache_get(key: str) -> Optional[str]:
+    """Look up a cached search in-process first, then in Redis"""
+    with _search_cache_lock:
+        entry = _search_cache.get(key)
+        if entry is not None:
+            if entry[1] >= time.monotonic():
+                _search_cache.move_to_end(key)
+                return entry[0]
+            del _search_cache[key]
+    if _redis is not None:
+        try:
+            value = _redis.get(key)
+        except redis.RedisError as e:
+            _log.warning(f"Redis search cache read failed: {e}")
+            return None
+        if value is not None:
+            _cache_set(key, value, remote=False)
+        return value
+    return None
+
+def _cache_set(key: str, value: str, remote: bool = True):
+    """Store a search result in-process and, when configured, in Redis"""
+    with _search_cache_lock:
+        _search_cache[key] = (value, time.monotonic() + SEARCH_CACHE_TTL)
+        _search_cache.move_to_end(key)
+        while len(_search_cache) > SEARCH_CACHE_MAX_ENTRIES:
+            _search_cache.popitem(last=False)
+    if remote and _redis is not None:
+        try:
+            _redis.setex(key, SEARCH_CACHE_TTL, value)
+        except redis.RedisError as e:
+            _log.warning(f"Redis search cache write failed: {e}")
+
+def clear_search_cache():
+    """Drop all cached search results, e.g. to force fresh results before the TTL runs out"""
+    with _search_cache_lock:
+        _search_cache.clear()
+    if _redis is not None:
+        for key in _redis.scan_iter("serper:*"):
+            _redis.delete(key)
+
 class SerperSearchInput(BaseModel):
     """Input schema for Serper search tool"""
     query: str = Field(..., description="Search query to execute")
@@ -38,43 +116,75 @@ class SerperSearchTool(BaseTool):
 
     def _run(self, query: str, num_results: int = 10, time_range: str = "", search_type: str = "search") -> str:
         """Execute search and return formatted results"""
+        key = _search_cache_key(query, num_results, time_range, search_type)
+        cached = _cache_get(key)
+        if cached is not None:
+            _log.debug(f"X-Cache: HIT serper {search_type} '{query}'")
+            return cached
+        
+        with _search_cache_lock:
+            pending = _inflight_searches.get(key)
+            owner = pending is None
+            if owner:
+                pending = _inflight_searches[key] = Future()
+        if not owner:
+            _log.debug(f"X-Cache: WAIT serper {search_type} '{query}'")
+            return pending.result()
+        _log.debug(f"X-Cache: MISS serper {search_type} '{query}'")
+        
         try:
-            api_key = self._get_api_key()
-            base_url = "https://google.serper.dev"
-            headers = {
-                "X-API-KEY": api_key,
-                "Content-Type": "application/json"
-            }
-            
-            # Prepare search payload
-            payload = {
-                "q": query,
-                "num": min(num_results, 100)  # API limit
-            }
-            
-            # Add time range if specified
-            if time_range:
-                payload["tbs"] = f"qdr:{time_range}"
-            
-            # Choose endpoint based on search type
-            endpoint = f"{base_url}/{search_type}"
-            
-            # Make API request
-            response = requests.post(endpoint, headers=headers, json=payload)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Format results based on search type
-            if search_type == "news":
-                return self._format_news_results(data, query)
-            else:
-                return self._format_search_results(data, query)
-                
+            result = self._fetch(key, query, num_results, time_range, search_type)
+            pending.set_result(result)
+            return result
+        finally:
+            with _search_cache_lock:
+                del _inflight_searches[key]
+            pending.cancel()  # no-op once a result is set
+
+    def _fetch(self, key: str, query: str, num_results: int, time_range: str, search_type: str) -> str:
+        """Run the search, caching only successful results so a transient failure is retried next call"""
+        try:
+            result = self._search(query, num_results, time_range, search_type)
         except requests.exceptions.RequestException as e:
             return f"Search error: {str(e)}"
         except Exception as e:
             return f"Unexpected error: {str(e)}"
+        
+        _cache_set(key, result)
+        return result
+
+    def _search(self, query: str, num_results: int, time_range: str, search_type: str) -> str:
+        """Call the Serper API and format the response"""
+        api_key = self._get_api_key()
+        headers = {
+            "X-API-KEY": api_key,
+            "Content-Type": "application/json"
+        }
+        
+        # Prepare search payload
+        payload = {
+            "q": query,
+            "num": min(num_results, 100)  # API limit
+        }
+        
+        # Add time range if specified
+        if time_range:
+            payload["tbs"] = f"qdr:{time_range}"
+        
+        # Choose endpoint based on search type
+        endpoint = f"{SERPER_BASE_URL}/{search_type}"
+        
+        # Make API request
+        response = _session.post(endpoint, headers=headers, json=payload, timeout=10.0)
+        response.raise_for_status()
+        
+        data = response.json()
+        
+        # Format results based on search type
+        if search_type == "news":
+            return self._format_news_results(data, query)
+        else:
+            return self._format_search_results(data, query)
 
     def _format_search_results(self, data: Dict[str, Any], query: str) -> str:
         """Format regular search results"""
@@ -150,6 +260,27 @@ class SerperSearchTool(BaseTool):
 # Create tool instance
 serper_tool = SerperSearchTool()
 
+_RESULT_ITEM_RE = re.compile(r"^\d+\. (.+?)$(.*?)(?=^\d+\. |\Z)", re.MULTILINE | re.DOTALL)
+_RESULT_FIELD_RE = re.compile(r"^\s+(URL|Description|Summary|Date): (.*)$", re.MULTILINE)
+
+def compact_search_results(raw: str, max_items: int = 10, max_chars: int = 4000) -> str:
+    """Shrink formatted search results to one 'title | snippet | url' line per item for prompt use"""
+    items = _RESULT_ITEM_RE.findall(raw)
+    if not items:  # error messages and empty searches pass through as-is
+        return raw[:max_chars]
+    
+    lines = [raw.split("\n", 1)[0]]
+    length = len(lines[0])
+    for title, body in items[:max_items]:
+        fields = dict(_RESULT_FIELD_RE.findall(body))
+        parts = [title, fields.get("Date"), fields.get("Description") or fields.get("Summary"), fields.get("URL")]
+        line = " | ".join(part for part in parts if part)
+        if length + len(line) + 1 > max_chars:
+            break
+        lines.append(line)
+        length += len(line) + 1
+    return "\n".join(lines)
+
 # Helper functions for common searches
 def search_ai_industry_news(days_back: int = 7) -> str:
     """Quick function to search for AI industry news"""
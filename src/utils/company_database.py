@@ -4,6 +4,7 @@ Company database and search utilities
 import json
 from typing import List, Dict, Any, Optional
 from difflib import SequenceMatcher
+from functools import lru_cache
 
 # Comprehensive company database organized by industry
 COMPANY_DATABASE = {
@@ -95,35 +96,64 @@ COMPANY_DATABASE = {
     }
 }
 
-def search_companies(query: str, limit: int = 10) -> List[Dict[str, Any]]:
-    """
-    Search for companies by name or description
-    
-    Args:
-        query: Search query string
-        limit: Maximum number of results to return
-    
-    Returns:
-        List of matching companies with similarity scores
+class CompanyIndex:
+    """Precomputed view of a company database for repeated searches
+
+    Lowercased names, descriptions and types are built once so each search
+    only pays for scoring, not for re-normalizing the whole dataset.
     """
-    if not query or len(query.strip()) < 2:
-        return []
-    
-    query = query.lower().strip()
-    results = []
-    
-    # Search through all companies in all industries
-    for industry, data in COMPANY_DATABASE.items():
-        for company in data["companies"]:
+
+    def __init__(self, database: Dict[str, Dict[str, Any]] = COMPANY_DATABASE):
+        self.companies = []
+        self.industries = []
+
+        for industry, data in database.items():
+            self.industries.append({
+                "name": industry,
+                "name_lower": industry.lower(),
+                "company_count": len(data["companies"]),
+                "sample_companies": [c["name"] for c in data["companies"][:3]]
+            })
+            for company in data["companies"]:
+                self.companies.append({
+                    "company": company,
+                    "industry": industry,
+                    "name_lower": company["name"].lower(),
+                    "description_lower": company["description"].lower(),
+                    "type_lower": company["type"].lower()
+                })
+
+    def search_companies(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Search for companies by name or description
+        
+        Args:
+            query: Search query string
+            limit: Maximum number of results to return
+        
+        Returns:
+            List of matching companies with similarity scores
+        """
+        if not query or len(query.strip()) < 2:
+            return []
+        
+        query = query.lower().strip()
+        query_words = query.split()
+        results = []
+        
+        for entry in self.companies:
+            name = entry["name_lower"]
+            description = entry["description_lower"]
+            
             # Calculate similarity scores
-            name_similarity = SequenceMatcher(None, query, company["name"].lower()).ratio()
-            desc_similarity = SequenceMatcher(None, query, company["description"].lower()).ratio()
-            type_similarity = SequenceMatcher(None, query, company["type"].lower()).ratio()
+            name_similarity = SequenceMatcher(None, query, name).ratio()
+            desc_similarity = SequenceMatcher(None, query, description).ratio()
+            type_similarity = SequenceMatcher(None, query, entry["type_lower"]).ratio()
             
             # Check for exact matches or partial matches
-            exact_match = query in company["name"].lower()
-            partial_match = any(word in company["name"].lower() for word in query.split())
-            desc_match = query in company["description"].lower()
+            exact_match = query in name
+            partial_match = any(word in name for word in query_words)
+            desc_match = query in description
             
             # Calculate overall score
             max_similarity = max(name_similarity, desc_similarity, type_similarity)
@@ -139,61 +169,78 @@ def search_companies(query: str, limit: int = 10) -> List[Dict[str, Any]]:
             else:
                 continue
             
+            company = entry["company"]
             results.append({
                 "name": company["name"],
                 "type": company["type"],
                 "description": company["description"],
-                "industry": industry,
+                "industry": entry["industry"],
                 "score": score
             })
-    
-    # Sort by score and return top results
-    results.sort(key=lambda x: x["score"], reverse=True)
-    return results[:limit]
+        
+        # Sort by score and return top results
+        results.sort(key=lambda x: x["score"], reverse=True)
+        return results[:limit]
 
-def search_industries(query: str) -> List[Dict[str, Any]]:
-    """
-    Search for industries by name or related terms
-    
-    Args:
-        query: Search query string
-    
-    Returns:
-        List of matching industries with company counts
-    """
-    if not query or len(query.strip()) < 2:
-        return []
-    
-    query = query.lower().strip()
-    results = []
-    
-    for industry, data in COMPANY_DATABASE.items():
-        # Calculate similarity with industry name
-        similarity = SequenceMatcher(None, query, industry.lower()).ratio()
+    def search_industries(self, query: str) -> List[Dict[str, Any]]:
+        """
+        Search for industries by name or related terms
         
-        # Check for partial matches
-        partial_match = any(word in industry.lower() for word in query.split())
-        exact_match = query in industry.lower()
+        Args:
+            query: Search query string
         
-        if exact_match:
-            score = 1.0
-        elif partial_match:
-            score = 0.8
-        elif similarity > 0.3:
-            score = similarity
-        else:
-            continue
+        Returns:
+            List of matching industries with company counts
+        """
+        if not query or len(query.strip()) < 2:
+            return []
         
-        results.append({
-            "name": industry,
-            "company_count": len(data["companies"]),
-            "sample_companies": [c["name"] for c in data["companies"][:3]],
-            "score": score
-        })
-    
-    # Sort by score
-    results.sort(key=lambda x: x["score"], reverse=True)
-    return results
+        query = query.lower().strip()
+        query_words = query.split()
+        results = []
+        
+        for entry in self.industries:
+            name = entry["name_lower"]
+            
+            # Calculate similarity with industry name
+            similarity = SequenceMatcher(None, query, name).ratio()
+            
+            # Check for partial matches
+            partial_match = any(word in name for word in query_words)
+            exact_match = query in name
+            
+            if exact_match:
+                score = 1.0
+            elif partial_match:
+                score = 0.8
+            elif similarity > 0.3:
+                score = similarity
+            else:
+                continue
+            
+            results.append({
+                "name": entry["name"],
+                "company_count": entry["company_count"],
+                "sample_companies": list(entry["sample_companies"]),
+                "score": score
+            })
+        
+        # Sort by score
+        results.sort(key=lambda x: x["score"], reverse=True)
+        return results
+
+@lru_cache(maxsize=1)
+def load_company_db() -> CompanyIndex:
+    """Build the search index over COMPANY_DATABASE once per process"""
+    return CompanyIndex()
+
+def search_companies(query: str, limit: int = 10) -> List[Dict[str, Any]]:
+    """Search for companies by name or description"""
+    return load_company_db().search_companies(query, limit=limit)
+
+def search_industries(query: str) -> List[Dict[str, Any]]:
+    """Search for industries by name or related terms"""
+    return load_company_db().search_industries(query)
 
 def get_industry_companies(industry: str) -> List[Dict[str, Any]]:
     """
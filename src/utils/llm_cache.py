@@ -0,0 +1,117 @@
+"""
+Two-tier cache for agent LLM responses (in-process LRU, optional Redis)
+"""
+import os
+import re
+import asyncio
+import time
+import hashlib
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Type
+
+import orjson
+from pydantic import BaseModel
+
+from .logger import logger
+
+try:
+    import redis
+except ImportError:  # Redis is optional; the in-process tier works on its own
+    redis = None
+
+# TTLs by analysis type: competitor activity moves slower than market news
+COMPETITOR_ANALYSIS_TTL = 4 * 3600
+MARKET_NEWS_TTL = 3600
+# Synthesis prompts embed the stored findings themselves, so a hit always reflects the same inputs
+STRATEGIC_SYNTHESIS_TTL = 24 * 3600
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+class LLMCache:
+    """Cache LLM completions keyed on a hash of the model and normalized prompt"""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._local: "OrderedDict[str, tuple]" = OrderedDict()
+        # Sync client run via asyncio.to_thread: the scheduler and UI start a fresh event loop
+        # per run, and an asyncio client's pooled connections stay bound to the first loop
+        self._redis = None
+        redis_url = os.getenv("REDIS_URL")
+        if redis_url and redis is not None:
+            self._redis = redis.Redis.from_url(redis_url, decode_responses=True)
+
+    @staticmethod
+    def make_key(model: str, prompt: str) -> str:
+        """Cache key; whitespace is collapsed so re-indented prompt templates still hit"""
+        normalized = _WHITESPACE_RE.sub(" ", prompt).strip()
+        return "llm:" + hashlib.sha256(f"{model}|{normalized}".encode("utf-8")).hexdigest()
+
+    def _get_local(self, key: str) -> Optional[str]:
+        """Look up the in-process tier, dropping the entry if it has expired"""
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at < time.monotonic():
+            del self._local[key]
+            return None
+        self._local.move_to_end(key)
+        return value
+
+    def _set_local(self, key: str, value: str, ttl: int):
+        """Store in the in-process tier, evicting the least recently used entry when full"""
+        self._local[key] = (value, time.monotonic() + ttl)
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_entries:
+            self._local.popitem(last=False)
+
+    async def get_or_compute(self, model: str, prompt: str, fn: Callable[[], Awaitable[str]], ttl: int) -> str:
+        """Return the cached completion for prompt, or await fn() and cache its result"""
+        key = self.make_key(model, prompt)
+
+        value = self._get_local(key)
+        if value is not None:
+            return value
+
+        if self._redis is not None:
+            try:
+                value = await asyncio.to_thread(self._redis.get, key)
+            except redis.RedisError as e:
+                logger.warning(f"Redis LLM cache read failed: {e}")
+                value = None
+            if value is not None:
+                self._set_local(key, value, ttl)
+                return value
+
+        value = await fn()
+        self._set_local(key, value, ttl)
+        if self._redis is not None:
+            try:
+                await asyncio.to_thread(self._redis.setex, key, ttl, value)
+            except redis.RedisError as e:
+                logger.warning(f"Redis LLM cache write failed: {e}")
+        return value
+
+async def cached_ainvoke(llm, prompt: str, ttl: int) -> str:
+    """ainvoke an agent's chat model through the shared cache and return the response text"""
+    async def complete() -> str:
+        return (await llm.ainvoke(prompt)).content
+    return await llm_cache.get_or_compute(llm.model_name, prompt, complete, ttl)
+
+_structured_llms: Dict[tuple, Any] = {}
+
+async def cached_structured_ainvoke(llm, schema: Type[BaseModel], prompt: str, ttl: int) -> Dict[str, Any]:
+    """ainvoke llm bound to a pydantic output schema through the shared cache and return the result as a dict"""
+    structured = _structured_llms.get((id(llm), schema))
+    if structured is None:
+        # Function calling rather than JSON mode: gpt-4, the default agent model, has no response_format support
+        structured = llm.with_structured_output(schema, method="function_calling")
+        _structured_llms[(id(llm), schema)] = structured
+
+    async def complete() -> str:
+        return (await structured.ainvoke(prompt)).model_dump_json()
+    text = await llm_cache.get_or_compute(f"{llm.model_name}:{schema.__name__}", prompt, complete, ttl)
+    return orjson.loads(text)
+
+# Shared cache instance
+llm_cache = LLMCache()
@@ -0,0 +1,31 @@
+"""
+Shared chat model clients for the agents
+"""
+import os
+from functools import lru_cache
+
+from langchain_openai import ChatOpenAI
+
+# Model used for aggregate and deep-dive analysis, and a cheaper one for per-item first passes
+AGENT_MODEL = os.getenv("AGENT_MODEL", "gpt-4")
+FAST_AGENT_MODEL = os.getenv("FAST_AGENT_MODEL", "gpt-4o-mini")
+# Model used by the strategic synthesis and trend agents
+SYNTHESIS_AGENT_MODEL = os.getenv("SYNTHESIS_AGENT_MODEL", "gpt-o3")
+
+@lru_cache(maxsize=8)
+def get_llm(model: str, temperature: float = 0.1) -> ChatOpenAI:
+    """Return the shared client for (model, temperature); ChatOpenAI is safe to ainvoke concurrently.
+    Timeouts keep a hung call from holding a concurrency slot forever. No shared http_async_client
+    is passed: the scheduler and UI start a fresh event loop per run, and pooled connections
+    opened on a previous loop cannot be reused on the next one."""
+    return ChatOpenAI(
+        model=model,
+        temperature=temperature,
+        openai_api_key=os.getenv("OPENAI_API_KEY"),
+        request_timeout=60,
+        max_retries=3
+    )
+
+# Clients shared by the market and competitor agents
+shared_llm = get_llm(AGENT_MODEL)
+fast_llm = get_llm(FAST_AGENT_MODEL)
@@ -1,8 +1,11 @@
 """
 Logging configuration for competitive analysis system
 """
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 from datetime import datetime
 from typing import Optional
 
@@ -41,29 +44,39 @@ class CompetitiveAnalysisLogger:
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
         
-        # Add handlers
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        # Callers only enqueue records; a listener thread does the file/console I/O,
+        # so concurrent agent tasks never block on log writes
+        log_queue = queue.SimpleQueue()
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self._listener = logging.handlers.QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self._listener.stop)
     
     def info(self, message: str, extra: Optional[dict] = None):
         """Log info message"""
-        self.logger.info(message, extra=extra)
+        self.logger.info(message, extra=extra, stacklevel=2)
     
     def warning(self, message: str, extra: Optional[dict] = None):
         """Log warning message"""
-        self.logger.warning(message, extra=extra)
+        self.logger.warning(message, extra=extra, stacklevel=2)
     
     def error(self, message: str, extra: Optional[dict] = None):
         """Log error message"""
-        self.logger.error(message, extra=extra)
+        self.logger.error(message, extra=extra, stacklevel=2)
     
     def debug(self, message: str, extra: Optional[dict] = None):
         """Log debug message"""
-        self.logger.debug(message, extra=extra)
+        self.logger.debug(message, extra=extra, stacklevel=2)
+    
+    def exception(self, message: str, extra: Optional[dict] = None):
+        """Log error message with the current exception's traceback"""
+        self.logger.exception(message, extra=extra, stacklevel=2)
     
     def critical(self, message: str, extra: Optional[dict] = None):
         """Log critical message"""
-        self.logger.critical(message, extra=extra)
+        self.logger.critical(message, extra=extra, stacklevel=2)
     
     def log_analysis_start(self, analysis_type: str):
         """Log analysis start"""